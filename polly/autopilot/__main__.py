@@ -7,6 +7,11 @@ from pathlib import Path
 from polly.autopilot.service import AutopilotService
 from polly.config import DEFAULT_CONFIG_PATH
 
+try:
+    import uvloop  # Optional: faster libuv-based event loop
+except ImportError:
+    uvloop = None
+
 
 def main():
     """Main entry point for autopilot service."""
@@ -23,8 +28,12 @@ def main():
     
     service = AutopilotService(DEFAULT_CONFIG_PATH)
     
+    # Use uvloop when installed, otherwise the default asyncio loop
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    
     try:
-        asyncio.run(service.run())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(service.run())
     except KeyboardInterrupt:
         print("\n")
         print("="*60)
@@ -151,7 +151,7 @@ class OpportunityScanner:
                     # Get Yes probabilities
                     top_probs = []
                     for m in top_markets:
-                        yes_prob = next((o.price for o in m.outcomes if o.outcome.lower() in ('yes', 'y')), 0.0)
+                        yes_prob = m.yes_price
                         top_probs.append(yes_prob)
                     
                     # Competitive if top candidate <80%
@@ -166,7 +166,7 @@ class OpportunityScanner:
                         reasons.append(f"{viable_count} viable candidates")
             else:
                 # Binary market - check if competitive
-                max_odds = max(o.price for o in item.outcomes) if item.outcomes else 1.0
+                max_odds = item.max_outcome_price if item.outcomes else 1.0
                 if max_odds < 0.80:
                     score += 10
                     reasons.append("competitive odds")
@@ -1,25 +1,41 @@
 """Autonomous trading service - runs continuously in background."""
 
 import asyncio
+import json
 import logging
 import os
+import random
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from dotenv import load_dotenv
 
 from polly.autopilot.logging_config import setup_logging
 from polly.autopilot.scanner import OpportunityScanner, Opportunity
 from polly.autopilot.wallet import WalletManager
-from polly.config import load_config, AppConfig
+from polly.config import load_config, AppConfig, AUTOPILOT_STATE_PATH
 from polly.models import Market, MarketGroup, ResearchProgress, Trade
 from polly.services.evaluator import PositionEvaluator
-from polly.services.polymarket import PolymarketService
+from polly.services.polymarket import PolymarketService, create_http_session
 from polly.services.research import ResearchService
 from polly.services.trading import TradingService
 from polly.storage.trades import TradeRepository
 
+_stake = attrgetter("stake_amount")
+
+# Log separators (built once, reused every cycle)
+_BANNER = "=" * 60
+_THIN = "─" * 40
+
+# Minimum cash needed before the scanner will look for new entries
+_MIN_SCAN_BALANCE = 20
+
+# Unchanged (balance, position count) cycles before the sleep starts doubling
+_IDLE_CYCLES_BEFORE_BACKOFF = 3
+_MAX_IDLE_BACKOFF = 16  # Cap as a multiple of price_refresh_seconds
+
 
 class AutopilotService:
     """Autonomous trading service that runs continuously.
@@ -42,9 +58,15 @@ class AutopilotService:
         self.running = False
         self.cycle_count = 0
         self.start_time = None
+        self._entries_this_cycle = 0  # Positions opened during the current cycle
+        self._last_state: Optional[tuple] = None  # (balance bucket, position count)
+        self._idle_streak = 0
+        
+        # Shared keep-alive HTTP session for all market fetches
+        self._http = create_http_session()
         
         # Initialize core services
-        self.polymarket = PolymarketService(self.config.polls)
+        self.polymarket = PolymarketService(self.config.polls, http=self._http)
         self.research_service = ResearchService(self.config.research)
         self.evaluator = PositionEvaluator(self.config.research)
         self.trade_repo = TradeRepository(self.config.database_path)
@@ -86,116 +108,220 @@ class AutopilotService:
         self.running = True
         self.start_time = datetime.now(tz=timezone.utc)
         
-        self.logger.info("="*60)
+        self.logger.info(_BANNER)
         self.logger.info("🚀 Polly Autopilot Service Started")
-        self.logger.info("="*60)
-        self.logger.info(f"Started at: {self.start_time.isoformat()}")
-        self.logger.info(f"Check interval: {self.config.trading.price_refresh_seconds}s")
-        self.logger.info("="*60)
+        self.logger.info(_BANNER)
+        self.logger.info("Started at: %s", self.start_time.isoformat())
+        self.logger.info("Check interval: %ss", self.config.trading.price_refresh_seconds)
+        self.logger.info(_BANNER)
         
         if not self.trading_service:
             self.logger.error("❌ Trading service unavailable - autopilot cannot run")
             self.logger.error("Set POLYGON_PRIVATE_KEY environment variable")
+            self._http.close()
             return
         
-        while self.running:
-            try:
-                await self.execute_trading_cycle()
-                self.cycle_count += 1
-                
-                # Sleep until next cycle
-                sleep_seconds = self.config.trading.price_refresh_seconds
-                self.logger.debug(f"Sleeping {sleep_seconds}s until next cycle...")
-                await asyncio.sleep(sleep_seconds)
-                
-            except KeyboardInterrupt:
-                self.logger.info("Autopilot stopped by user (Ctrl+C)")
-                break
-            except Exception as e:
-                self.logger.error(f"Cycle error: {e}", exc_info=True)
-                self.logger.warning("Waiting 60s before retry...")
-                await asyncio.sleep(60)  # Wait 1 min on error
+        try:
+            while self.running:
+                try:
+                    next_interval = await self.execute_trading_cycle()
+                    self.cycle_count += 1
+                    self._write_state()
+                    
+                    # Sleep until next cycle (±10% jitter so instances don't align)
+                    sleep_seconds = next_interval * (1 + random.uniform(-0.1, 0.1))
+                    self.logger.debug("Sleeping %.0fs until next cycle...", sleep_seconds)
+                    await asyncio.sleep(sleep_seconds)
+                    
+                except KeyboardInterrupt:
+                    self.logger.info("Autopilot stopped by user (Ctrl+C)")
+                    break
+                except Exception as e:
+                    self.logger.error("Cycle error: %s", e)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Cycle error traceback", exc_info=True)
+                    self.logger.warning("Waiting 60s before retry...")
+                    await asyncio.sleep(60)  # Wait 1 min on error
+        finally:
+            self._http.close()
+            # Research reuses one Grok client across cycles; release it on this loop
+            await self.research_service.close()
         
         uptime = datetime.now(tz=timezone.utc) - self.start_time
-        self.logger.info("="*60)
-        self.logger.info(f"Autopilot stopped after {self.cycle_count} cycles")
-        self.logger.info(f"Uptime: {uptime}")
-        self.logger.info("="*60)
+        self.logger.info(_BANNER)
+        self.logger.info("Autopilot stopped after %d cycles", self.cycle_count)
+        self.logger.info("Uptime: %s", uptime)
+        self.logger.info(_BANNER)
+    
+    def _write_state(self) -> None:
+        """Persist cycle count so `/autopilot status` doesn't have to scan the log."""
+        state = {
+            "cycle_count": self.cycle_count,
+            "last_cycle_ts": datetime.now(tz=timezone.utc).isoformat(),
+        }
+        try:
+            tmp_path = AUTOPILOT_STATE_PATH.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(state))
+            os.replace(tmp_path, AUTOPILOT_STATE_PATH)  # Atomic swap
+        except Exception as e:
+            self.logger.debug("Could not write autopilot state: %s", e)
     
-    async def execute_trading_cycle(self):
+    async def execute_trading_cycle(self) -> float:
         """Execute one complete trading cycle.
         
         Cycle steps:
         1. Check wallet balance
-        2. Monitor existing positions
-        3. Scan for new opportunities (future)
+        2. Monitor existing positions  } run concurrently
+        3. Scan for new opportunities  }
         4. Risk checks
+        
+        Returns:
+            Suggested seconds until the next cycle (backs off when idle)
         """
         cycle_start = datetime.now(tz=timezone.utc)
         
-        self.logger.info("")
-        self.logger.info("="*60)
-        self.logger.info(f"Cycle {self.cycle_count + 1} started")
-        self.logger.info("="*60)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("")
+            self.logger.info(_BANNER)
+            self.logger.info("Cycle %d started", self.cycle_count + 1)
+            self.logger.info(_BANNER)
         
-        # Step 1: Refresh wallet balance
+        # Step 1: Refresh wallet balance and market list (cached for the rest of the cycle)
+        self.wallet_manager.invalidate()
+        self.polymarket.invalidate_cache()
         balance = await self.wallet_manager.get_available_balance()
-        self.logger.info(f"💰 Available balance: ${balance:.2f} USDC")
-        
-        # Step 2: Monitor existing positions
-        await self.monitor_positions(balance)
+        self.logger.info("💰 Available balance: $%.2f USDC", balance)
         
-        # Step 3: Scan for new opportunities
-        await self.scan_opportunities(balance)
+        # Load active real trades once and share them across the cycle steps
+        active_trades = self.trade_repo.list_active(filter_mode="real")
+        self._entries_this_cycle = 0
+        
+        # Nothing to monitor and too little cash to scan: skip the rest of the cycle
+        if not active_trades and balance < _MIN_SCAN_BALANCE:
+            self.logger.info("💤 Idle cycle - no positions and balance below $%d", _MIN_SCAN_BALANCE)
+            return self._next_interval(balance, active_trades)
+        
+        # Steps 2 + 3: Monitor existing positions and scan for new opportunities.
+        # Both only read the pre-scan trade list, so their market I/O overlaps.
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(
+                self.monitor_positions(balance, now=cycle_start, active_trades=active_trades)
+            )
+            tg.create_task(self.scan_opportunities(balance, active_trades=active_trades))
         
         # Step 4: Future - Portfolio optimization
         # await self.optimize_portfolio(balance)
         
-        # Step 5: Risk checks
-        await self.check_risk_limits()
+        # Step 5: Risk checks (reload only if the scan opened new positions)
+        if self._entries_this_cycle:
+            active_trades = self.trade_repo.list_active(filter_mode="real")
+        await self.check_risk_limits(active_trades)
         
         duration = (datetime.now(tz=timezone.utc) - cycle_start).total_seconds()
-        self.logger.info(f"✓ Cycle {self.cycle_count + 1} completed in {duration:.1f}s")
+        self.logger.info("✓ Cycle %d completed in %.1fs", self.cycle_count + 1, duration)
+        
+        return self._next_interval(balance, active_trades)
     
-    async def monitor_positions(self, available_balance: float):
-        """Monitor all active positions and take actions if needed."""
+    def _next_interval(self, balance: float, active_trades: List[Trade]) -> float:
+        """Pick the sleep before the next cycle, backing off while idle and unchanged.
+        
+        Backoff only applies with no open positions; otherwise the base
+        interval is used so positions keep being monitored on time.
+        
+        Args:
+            balance: Wallet balance seen this cycle
+            active_trades: Active positions at the end of the cycle
+        
+        Returns:
+            Seconds to sleep before the next cycle
+        """
+        state = (round(balance), len(active_trades))
+        if state == self._last_state:
+            self._idle_streak += 1
+        else:
+            self._idle_streak = 0
+            self._last_state = state
+        
+        base_interval = self.config.trading.price_refresh_seconds
+        # Open positions need stop-loss/take-profit checks at the base rate,
+        # however long the balance and position count stay the same
+        if active_trades:
+            return base_interval
+        interval = base_interval * 4
+        
+        # Double the sleep for every unchanged cycle past the threshold (bounded)
+        extra = self._idle_streak - _IDLE_CYCLES_BEFORE_BACKOFF
+        if extra >= 0:
+            interval = min(interval * 2 ** (extra + 1), base_interval * _MAX_IDLE_BACKOFF)
+        return interval
+    
+    async def monitor_positions(
+        self,
+        available_balance: float,
+        now: Optional[datetime] = None,
+        active_trades: Optional[List[Trade]] = None,
+    ):
+        """Monitor all active positions and take actions if needed.
+        
+        Args:
+            available_balance: Current available wallet balance
+            now: Cycle timestamp shared by every position (defaults to current time)
+            active_trades: Active real trades already loaded this cycle (queried if None)
+        """
+        if now is None:
+            now = datetime.now(tz=timezone.utc)
         
         # Get active real trades only
-        active_trades = self.trade_repo.list_active(filter_mode="real")
+        if active_trades is None:
+            active_trades = self.trade_repo.list_active(filter_mode="real")
         
         if not active_trades:
             self.logger.info("📊 No active positions to monitor")
             return
         
-        self.logger.info(f"📊 Monitoring {len(active_trades)} active position(s)...")
+        self.logger.info("📊 Monitoring %d active position(s)...", len(active_trades))
+        
+        # Prefetch all position markets in one request instead of one per trade
+        try:
+            markets = await self.polymarket.fetch_markets_by_ids([t.market_id for t in active_trades])
+        except Exception as e:
+            self.logger.error("  ✗ Error fetching position markets: %s", e, exc_info=True)
+            return
+        markets_by_id = {m.id: m for m in markets}
         
+        # Markets are prefetched, so each check is local work: run them in order
         for trade in active_trades:
-            await self._monitor_single_position(trade, available_balance)
+            try:
+                await self._monitor_single_position(
+                    trade, available_balance, markets_by_id.get(trade.market_id), now
+                )
+            except Exception as e:
+                self.logger.error("  ✗ Error monitoring position #%s: %s", trade.id, e)
     
-    async def _monitor_single_position(self, trade: Trade, available_balance: float):
-        """Monitor a single position."""
-        
-        self.logger.info("")
-        self.logger.info("─"*40)
-        self.logger.info(f"Position #{trade.id}: {trade.question[:50]}")
+    async def _monitor_single_position(
+        self,
+        trade: Trade,
+        available_balance: float,
+        market: Optional[Market],
+        now: datetime,
+    ):
+        """Monitor a single position against its prefetched market state."""
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("")
+            self.logger.info(_THIN)
+            self.logger.info("Position #%s: %.50s", trade.id, trade.question)
         
         try:
-            # Fetch current market state
-            market = await self.polymarket.fetch_market_by_id(trade.market_id)
-            
             if not market:
-                self.logger.warning(f"  ⚠️  Could not fetch market - may be resolved or delisted")
+                self.logger.warning("  ⚠️  Could not fetch market - may be resolved or delisted")
                 return
             
             # Get current odds
-            current_odds = 0.0
-            for outcome in market.outcomes:
-                if outcome.outcome == trade.selected_option:
-                    current_odds = outcome.price
-                    break
+            current_odds = market.price_by_outcome.get(trade.selected_option, 0.0)
             
             # Calculate metrics
-            days_left = (trade.resolves_at - datetime.now(tz=timezone.utc)).days
+            days_left = (trade.resolves_at - now).days
             entry_odds = trade.entry_odds
             odds_change = current_odds - entry_odds
             
@@ -204,26 +330,32 @@ class AutopilotService:
             current_value = shares * current_odds
             unrealized_pnl = current_value - trade.stake_amount
             
-            self.logger.info(f"  Entry: {entry_odds:.1%} → Current: {current_odds:.1%} ({odds_change:+.1%})")
-            self.logger.info(f"  Unrealized P&L: ${unrealized_pnl:+.2f}")
-            self.logger.info(f"  Days left: {days_left}")
+            self.logger.info(
+                "  Entry: %.1f%% → Current: %.1f%% (%+.1f%%)",
+                entry_odds * 100, current_odds * 100, odds_change * 100,
+            )
+            self.logger.info("  Unrealized P&L: $%+.2f", unrealized_pnl)
+            self.logger.info("  Days left: %d", days_left)
             
             # For now, just monitor - future: add trigger detection and actions
             self.logger.info("  → Hold (monitoring only - actions coming soon)")
             
         except Exception as e:
-            self.logger.error(f"  ✗ Error monitoring position: {e}", exc_info=True)
+            self.logger.error("  ✗ Error monitoring position: %s", e)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("  Monitoring traceback", exc_info=True)
     
-    async def scan_opportunities(self, available_balance: float):
+    async def scan_opportunities(self, available_balance: float, active_trades: Optional[List[Trade]] = None):
         """Scan for new trading opportunities."""
         
         # Need minimum balance to trade
-        if available_balance < 20:
+        if available_balance < _MIN_SCAN_BALANCE:
             self.logger.info("🔎 Skipping opportunity scan (balance < $20)")
             return
         
         # Check position count
-        active_trades = self.trade_repo.list_active(filter_mode="real")
+        if active_trades is None:
+            active_trades = self.trade_repo.list_active(filter_mode="real")
         if len(active_trades) >= 30:
             self.logger.info("🔎 Skipping opportunity scan (max 30 positions)")
             return
@@ -247,7 +379,7 @@ class AutopilotService:
                 available_balance = await self.wallet_manager.get_available_balance()
                 
                 # Stop if balance too low
-                if available_balance < 20:
+                if available_balance < _MIN_SCAN_BALANCE:
                     self.logger.info("  Balance now < $20, stopping opportunity search")
                     break
             
@@ -312,7 +444,7 @@ class AutopilotService:
             return
         
         # Calculate position size
-        current_exposure = sum(t.stake_amount for t in self.trade_repo.list_active(filter_mode="real"))
+        current_exposure = sum(map(_stake, self.trade_repo.list_active(filter_mode="real")))
         safe_stake = self.wallet_manager.calculate_position_size(
             recommended_stake=self.config.trading.default_stake,
             available_balance=available_balance,
@@ -337,6 +469,9 @@ class AutopilotService:
                 self.logger.error(f"   ✗ Trade failed: {result.error}")
                 return
             
+            self.wallet_manager.debit_cached(safe_stake)
+            self._entries_this_cycle += 1
+            
             # Record trade
             trade = Trade(
                 id=None,
@@ -434,7 +569,7 @@ class AutopilotService:
         
         # Calculate total and scale to balance
         total_recommended = sum(rec.suggested_stake for rec, _ in matched_recs)
-        current_exposure = sum(t.stake_amount for t in self.trade_repo.list_active(filter_mode="real"))
+        current_exposure = sum(map(_stake, self.trade_repo.list_active(filter_mode="real")))
         
         # Can only use 80% of balance
         max_deployable = available_balance * 0.80
@@ -461,7 +596,7 @@ class AutopilotService:
                 continue
             
             # Find the market - try multiple matching strategies
-            market = next((m for m in group.markets if m.id == rec.market_id), None)
+            market = group.find_market(rec.market_id)
             
             # If ID match fails, try matching by question text
             if not market:
@@ -469,11 +604,9 @@ class AutopilotService:
                 rec_candidate = rec.market_question.split("Will ")[-1].split(" win")[0].strip() if "Will " in rec.market_question else rec.market_question.split(" ")[ 0]
                 
                 # Try to find by candidate name in question
-                for m in group.markets:
-                    if rec_candidate.lower() in m.question.lower():
-                        market = m
-                        self.logger.debug(f"      Matched by name: {rec_candidate} → {m.question[:50]}")
-                        break
+                market = group.find_market(rec.market_id, rec_candidate)
+                if market:
+                    self.logger.debug(f"      Matched by name: {rec_candidate} → {market.question[:50]}")
             
             if not market:
                 candidate_name = rec.market_question[:40]
@@ -481,15 +614,15 @@ class AutopilotService:
                 continue
             
             # Find Yes outcome
-            yes_outcome = next((o for o in market.outcomes if o.outcome.lower() in ('yes', 'y')), None)
+            yes_outcome = market.yes_outcome
             if not yes_outcome:
                 continue
             
             current_odds = yes_outcome.price
+            candidate_name = market.question.split("Will ")[-1].split(" win")[0] if "Will " in market.question else market.question[:30]
             
             # FILTER: Skip positions with >80% odds (no edge, won't fill)
             if current_odds > 0.80:
-                candidate_name = market.question.split("Will ")[-1].split(" win")[0] if "Will " in market.question else market.question[:30]
                 self.logger.info(f"      → Skip {candidate_name} @ {current_odds:.1%}: Too high (>80% filter)")
                 continue
             
@@ -497,14 +630,11 @@ class AutopilotService:
             if current_odds < 0.05:  # Extreme longshot (<5%)
                 is_valid, reason = self.evaluator.validate_longshot(rec, current_odds)
                 if not is_valid:
-                    candidate_name = market.question.split("Will ")[-1].split(" win")[0] if "Will " in market.question else market.question[:30]
                     self.logger.info(f"      → Skip longshot {candidate_name} @ {current_odds:.1%}: {reason}")
                     continue
                 else:
                     self.logger.info(f"      ✓ Longshot validated @ {current_odds:.1%}: {reason}")
             
-            candidate_name = market.question.split("Will ")[-1].split(" win")[0] if "Will " in market.question else market.question[:30]
-            
             self.logger.info(f"      ➕ Entering ${safe_stake:.2f} on {candidate_name} @ {yes_outcome.price:.1%}")
             
             try:
@@ -516,6 +646,9 @@ class AutopilotService:
                     self.logger.error(f"      ✗ Failed: {result.error}")
                     continue
                 
+                self.wallet_manager.debit_cached(safe_stake)
+                self._entries_this_cycle += 1
+                
                 # Record trade
                 trade = Trade(
                     id=None,
@@ -559,7 +692,7 @@ class AutopilotService:
                 self.logger.error(f"      ✗ Error: {e}", exc_info=True)
         
         if entered_positions:
-            total_deployed = sum(t.stake_amount for t in entered_positions)
+            total_deployed = sum(map(_stake, entered_positions))
             self.logger.info(f"   ✓ Entered {len(entered_positions)} positions, total: ${total_deployed:.2f}")
             
             # Log to trades.log
@@ -570,28 +703,30 @@ class AutopilotService:
         else:
             self.logger.info(f"   → No positions entered (all too small or failed)")
     
-    async def check_risk_limits(self):
+    async def check_risk_limits(self, active_trades: Optional[List[Trade]] = None):
         """Check portfolio-level risk limits."""
         
         # Get all active trades
-        active_trades = self.trade_repo.list_active(filter_mode="real")
+        if active_trades is None:
+            active_trades = self.trade_repo.list_active(filter_mode="real")
         
         if not active_trades:
             return
         
-        # Calculate total exposure
-        total_exposure = sum(t.stake_amount for t in active_trades)
-        
-        # Get balance
+        # Get balance (cached this cycle, already debited for new entries)
         balance = await self.wallet_manager.get_available_balance()
-        total_portfolio = balance + total_exposure
         
-        # Check utilization
+        # Calculate total exposure (map/attrgetter keeps the loop in C)
+        total_exposure = sum(map(_stake, active_trades))
+        total_portfolio = balance + total_exposure
         utilization = total_exposure / total_portfolio if total_portfolio > 0 else 0
         
-        self.logger.info(f"")
-        self.logger.info(f"💼 Portfolio: ${total_portfolio:.2f} total (${balance:.2f} cash, ${total_exposure:.2f} in positions)")
-        self.logger.info(f"📊 Utilization: {utilization:.1%}")
+        self.logger.info("")
+        self.logger.info(
+            "💼 Portfolio: $%.2f total ($%.2f cash, $%.2f in positions)",
+            total_portfolio, balance, total_exposure,
+        )
+        self.logger.info("📊 Utilization: %.1f%%", utilization * 100)
         
         # Warn if over-utilized
         if utilization > 0.90:
@@ -1,6 +1,7 @@
 """Wallet management for autopilot service."""
 
 import logging
+import time
 from typing import Optional
 
 from polly.services.trading import TradingService
@@ -14,17 +15,35 @@ class WalletManager:
         self.config = config
         self.gas_reserve = 10.0  # Always keep $10 for gas
         self.logger = logging.getLogger("autopilot.wallet")
+        # Position limits are fixed for the config's lifetime, so resolve them once
+        autopilot_config = getattr(config, 'autopilot', None)
+        self.max_pct = getattr(autopilot_config, 'max_position_pct', 0.05)  # Default 5%
+        self.capital_util = getattr(autopilot_config, 'capital_utilization', 0.80)  # Default 80%
+        # Short-lived balance cache so a single cycle doesn't re-hit the RPC
+        self.balance_ttl = 15.0  # seconds
+        self._balance_cache: float | None = None
+        self._balance_cache_at = 0.0
     
-    async def get_available_balance(self) -> float:
+    async def get_available_balance(self, force: bool = False) -> float:
         """Get spendable USDC balance.
         
         Returns available balance after reserving for gas.
         Returns 0 if trading service unavailable or error.
+        
+        Args:
+            force: Bypass the short-TTL cache and fetch a fresh balance
         """
         if not self.trading:
             self.logger.warning("Trading service not available")
             return 0.0
         
+        if (
+            not force
+            and self._balance_cache is not None
+            and time.monotonic() - self._balance_cache_at < self.balance_ttl
+        ):
+            return self._balance_cache
+        
         try:
             balances = self.trading.get_balances()
             
@@ -39,11 +58,25 @@ class WalletManager:
             
             self.logger.debug(f"Wallet: ${usdc:.2f} total, ${available:.2f} available (${self.gas_reserve} gas reserve)")
             
+            self._balance_cache = available
+            self._balance_cache_at = time.monotonic()
             return available
         except Exception as e:
             self.logger.error(f"Error fetching balance: {e}", exc_info=True)
             return 0.0
     
+    def invalidate(self) -> None:
+        """Drop the cached balance so the next read hits the wallet."""
+        self._balance_cache = None
+    
+    def debit_cached(self, amount: float) -> None:
+        """Subtract a just-spent stake from the cached balance.
+        
+        Keeps the cache accurate after a trade without another RPC round-trip.
+        """
+        if self._balance_cache is not None:
+            self._balance_cache = max(0.0, self._balance_cache - amount)
+    
     def calculate_position_size(
         self,
         recommended_stake: float,
@@ -65,20 +98,10 @@ class WalletManager:
         total_portfolio = available_balance + self.gas_reserve + current_exposure
         
         # Max 5% per position (configurable)
-        max_position_pct = getattr(self.config, 'autopilot', None)
-        if max_position_pct and hasattr(max_position_pct, 'max_position_pct'):
-            max_pct = max_position_pct.max_position_pct
-        else:
-            max_pct = 0.05  # Default 5%
-        
-        max_position = total_portfolio * max_pct
+        max_position = total_portfolio * self.max_pct
         
         # Cap by capital utilization (default 80%)
-        capital_util = 0.80
-        if max_position_pct and hasattr(max_position_pct, 'capital_utilization'):
-            capital_util = max_position_pct.capital_utilization
-        
-        max_spendable = available_balance * capital_util
+        max_spendable = available_balance * self.capital_util
         
         # Use minimum of all constraints
         actual_stake = min(
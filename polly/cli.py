@@ -2,23 +2,25 @@
 
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import FileHistory
-from rich.console import Console
 
 from polly.config import load_config, DEFAULT_CONFIG_PATH, AppConfig
 from polly.models import Market, MarketGroup
 from polly.services.evaluator import PositionEvaluator
 from polly.services.polymarket import PolymarketService
 from polly.services.research import ResearchService
+from polly.services.runtime import run_coro, shutdown_loop
 from polly.services.trading import TradingService
 from polly.storage.research import ResearchRepository
 from polly.storage.trades import TradeRepository
 from polly.ui.banner import display_banner
+from polly.ui.console import console
 
 # Import command handlers
 from polly.commands.help import handle_help
@@ -29,8 +31,6 @@ from polly.commands.research import handle_research
 from polly.commands.trade import handle_trade, handle_close
 from polly.commands.autopilot import handle_autopilot
 
-console = Console()
-
 # Load environment variables
 load_dotenv()
 
@@ -38,6 +38,33 @@ load_dotenv()
 HISTORY_FILE = Path.home() / ".polly" / "history.txt"
 
 
+class BufferedFileHistory(FileHistory):
+    """FileHistory that batches appends instead of opening the file per command.
+    
+    Entries are written in FileHistory's on-disk format, so the file stays
+    readable by the stock loader. Call flush() before exiting.
+    """
+    
+    def __init__(self, filename: str, batch_size: int = 8):
+        super().__init__(filename)
+        self.batch_size = batch_size
+        self._pending: List[str] = []
+    
+    def store_string(self, string: str) -> None:
+        lines = "".join(f"+{line}\n" for line in string.split("\n"))
+        self._pending.append(f"\n# {datetime.now()}\n{lines}")
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write any buffered entries to disk in a single append."""
+        if not self._pending:
+            return
+        with open(self.filename, "ab") as f:
+            f.write("".join(self._pending).encode("utf-8"))
+        self._pending.clear()
+
+
 class CommandContext:
     """Holds all services and state for command handlers."""
     
@@ -95,13 +122,14 @@ def check_api_key() -> bool:
 
 def ensure_config() -> None:
     """Ensure default config directory and file exist."""
-    config_dir = DEFAULT_CONFIG_PATH.parent
-    config_dir.mkdir(parents=True, exist_ok=True)
+    # Fast path: a single stat when the config is already in place
+    if DEFAULT_CONFIG_PATH.exists():
+        return
     
-    if not DEFAULT_CONFIG_PATH.exists():
-        console.print(f"[yellow]Creating default config at {DEFAULT_CONFIG_PATH}[/yellow]")
-        
-        default_config = """# Polly Configuration
+    DEFAULT_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    console.print(f"[yellow]Creating default config at {DEFAULT_CONFIG_PATH}[/yellow]")
+    
+    default_config = """# Polly Configuration
 
 research:
   min_confidence_threshold: 70
@@ -129,7 +157,91 @@ polls:
 database:
   path: ~/.polly/trades.db
 """
-        DEFAULT_CONFIG_PATH.write_text(default_config)
+    DEFAULT_CONFIG_PATH.write_text(default_config)
+
+
+def _cmd_help(context: CommandContext, args: str) -> None:
+    handle_help()
+
+
+def _cmd_polls(context: CommandContext, args: str) -> None:
+    context.markets_cache = handle_polls(args, context.polymarket)
+
+
+def _cmd_research(context: CommandContext, args: str) -> None:
+    handle_research(
+        args=args,
+        markets_cache=context.markets_cache,
+        polymarket=context.polymarket,
+        research_service=context.research_service,
+        evaluator=context.evaluator,
+        research_repo=context.research_repo,
+        trade_repo=context.trade_repo,
+        research_config=context.config.research,
+        trading_config=context.config.trading,
+        trading_service=context.trading_service,
+    )
+
+
+def _cmd_portfolio(context: CommandContext, args: str) -> None:
+    handle_portfolio(
+        context.trade_repo,
+        context.config.trading,
+        context.trading_service,
+    )
+
+
+def _cmd_history(context: CommandContext, args: str) -> None:
+    handle_history(args, context.research_repo, context.polymarket)
+
+
+def _cmd_trade(context: CommandContext, args: str) -> None:
+    handle_trade(
+        args,
+        context.markets_cache,
+        context.trading_service,
+        context.trade_repo,
+        context.config.trading,
+    )
+
+
+def _cmd_close(context: CommandContext, args: str) -> None:
+    handle_close(
+        args,
+        context.trade_repo,
+        context.trading_service,
+        context.config.trading,
+        context.markets_cache,
+    )
+
+
+def _cmd_refresh(context: CommandContext, args: str) -> None:
+    context.polymarket.invalidate_cache()
+    console.print("[green]Market cache cleared - next /polls will refetch from Polymarket[/green]")
+
+
+def _cmd_autopilot(context: CommandContext, args: str) -> None:
+    handle_autopilot(args)
+
+
+def _cmd_exit(context: CommandContext, args: str) -> None:
+    console.print("[yellow]Goodbye![/yellow]")
+    sys.exit(0)
+
+
+# Command dispatch table (built once at import time)
+COMMANDS: Dict[str, Callable[[CommandContext, str], None]] = {
+    "/help": _cmd_help,
+    "/polls": _cmd_polls,
+    "/research": _cmd_research,
+    "/portfolio": _cmd_portfolio,
+    "/history": _cmd_history,
+    "/trade": _cmd_trade,
+    "/close": _cmd_close,
+    "/refresh": _cmd_refresh,
+    "/autopilot": _cmd_autopilot,
+    "/exit": _cmd_exit,
+}
 
 
 def route_command(command: str, context: CommandContext) -> None:
@@ -149,62 +261,10 @@ def route_command(command: str, context: CommandContext) -> None:
     cmd = parts[0].lower()
     args = parts[1] if len(parts) > 1 else ""
     
-    # Route to handlers
-    if cmd == "/help":
-        handle_help()
-    
-    elif cmd == "/polls":
-        context.markets_cache = handle_polls(args, context.polymarket)
-    
-    elif cmd == "/research":
-        handle_research(
-            args=args,
-            markets_cache=context.markets_cache,
-            polymarket=context.polymarket,
-            research_service=context.research_service,
-            evaluator=context.evaluator,
-            research_repo=context.research_repo,
-            trade_repo=context.trade_repo,
-            research_config=context.config.research,
-            trading_config=context.config.trading,
-            trading_service=context.trading_service,
-        )
-    
-    elif cmd == "/portfolio":
-        handle_portfolio(
-            context.trade_repo,
-            context.config.trading,
-            context.trading_service,
-        )
-    
-    elif cmd == "/history":
-        handle_history(args, context.research_repo, context.polymarket)
-    
-    elif cmd == "/trade":
-        handle_trade(
-            args,
-            context.markets_cache,
-            context.trading_service,
-            context.trade_repo,
-            context.config.trading,
-        )
-    
-    elif cmd == "/close":
-        handle_close(
-            args,
-            context.trade_repo,
-            context.trading_service,
-            context.config.trading,
-            context.markets_cache,
-        )
-    
-    elif cmd.startswith("/autopilot"):
-        handle_autopilot(args)
-    
-    elif cmd == "/exit":
-        console.print("[yellow]Goodbye![/yellow]")
-        sys.exit(0)
-    
+    # Route to handler
+    handler = COMMANDS.get(cmd)
+    if handler:
+        handler(context, args)
     else:
         console.print(f"[red]Unknown command: {cmd}[/red]")
         console.print("[dim]Type /help to see available commands[/dim]")
@@ -238,32 +298,45 @@ def main() -> None:
         sys.exit(1)
     
     # Ensure history file directory exists
-    HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if not HISTORY_FILE.parent.is_dir():
+        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
     
-    # Create prompt session with history
+    # Create prompt session with history (appends are batched, flushed on exit)
+    history = BufferedFileHistory(str(HISTORY_FILE))
     session = PromptSession(
-        history=FileHistory(str(HISTORY_FILE)),
+        history=history,
         enable_history_search=True,
     )
     
     # Main command loop
-    while True:
-        try:
-            # Use prompt_toolkit for input with history support
-            command = session.prompt("\npolly> ").strip()
-            if command:
-                route_command(command, context)
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Goodbye![/yellow]")
-            break
-        except EOFError:
-            console.print("\n[yellow]Goodbye![/yellow]")
-            break
-        except Exception as e:
-            console.print(f"[red]Error: {e}[/red]")
-            # In production, you might want to log full traceback
-            import traceback
-            console.print(f"[dim]{traceback.format_exc()}[/dim]")
+    try:
+        while True:
+            try:
+                # Use prompt_toolkit for input with history support
+                command = session.prompt("\npolly> ").strip()
+                if command:
+                    route_command(command, context)
+            except KeyboardInterrupt:
+                console.print("\n[yellow]Goodbye![/yellow]")
+                break
+            except EOFError:
+                console.print("\n[yellow]Goodbye![/yellow]")
+                break
+            except Exception as e:
+                console.print(f"[red]Error: {e}[/red]")
+                # In production, you might want to log full traceback
+                import traceback
+                console.print(f"[dim]{traceback.format_exc()}[/dim]")
+    finally:
+        # Also runs on /exit, which raises SystemExit
+        history.flush()
+        # Close the cached Grok client on the loop it belongs to, then stop the loop
+        if context.research_service.has_client:
+            try:
+                run_coro(context.research_service.close())
+            except Exception:
+                pass
+        shutdown_loop()
 
 
 if __name__ == "__main__":
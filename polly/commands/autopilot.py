@@ -1,13 +1,20 @@
 """Autopilot monitoring commands for Polly CLI."""
 
+import json
+import os
+import re
 from pathlib import Path
 from datetime import datetime
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-console = Console()
+from polly.config import AUTOPILOT_STATE_PATH
+from polly.ui.console import console
+
+# Level field of the autopilot log format ("... | INFO     | ...")
+LEVEL_RE = re.compile(r" (ERROR|WARNING|INFO) ")
+LEVEL_STYLES = {"ERROR": "red", "WARNING": "yellow", "INFO": "dim"}
 
 
 def handle_autopilot(args: str) -> None:
@@ -48,40 +55,45 @@ def _show_status():
     # Check recent activity (last 5 minutes)
     try:
         # Read last line of log
-        with open(autopilot_log, 'r') as f:
-            lines = f.readlines()
-            if lines:
-                last_line = lines[-1]
-                # Extract timestamp
-                if " | " in last_line:
-                    timestamp_str = last_line.split(" | ")[0]
-                    try:
-                        last_activity = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                        time_since = (datetime.now() - last_activity).total_seconds()
-                        
-                        is_running = time_since < 300  # Active within last 5 minutes
-                        
-                        if is_running:
-                            status_color = "green"
-                            status_text = "RUNNING"
-                        else:
-                            status_color = "yellow"
-                            status_text = f"STOPPED (last activity {int(time_since/60)} min ago)"
-                    except:
+        lines = _tail_lines(autopilot_log, 1)
+        if lines:
+            last_line = lines[-1]
+            # Extract timestamp
+            if " | " in last_line:
+                timestamp_str = last_line.split(" | ")[0]
+                try:
+                    last_activity = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
+                    time_since = (datetime.now() - last_activity).total_seconds()
+                    
+                    is_running = time_since < 300  # Active within last 5 minutes
+                    
+                    if is_running:
+                        status_color = "green"
+                        status_text = "RUNNING"
+                    else:
                         status_color = "yellow"
-                        status_text = "UNKNOWN"
-                else:
+                        status_text = f"STOPPED (last activity {int(time_since/60)} min ago)"
+                except:
                     status_color = "yellow"
                     status_text = "UNKNOWN"
             else:
                 status_color = "yellow"
-                status_text = "NO ACTIVITY"
+                status_text = "UNKNOWN"
+        else:
+            status_color = "yellow"
+            status_text = "NO ACTIVITY"
     except Exception as e:
         console.print(f"[red]Error reading logs: {e}[/red]")
         return
     
-    # Count recent cycles
-    cycle_count = sum(1 for line in lines if "Cycle" in line and "started" in line)
+    # Count cycles from the service's state file, falling back to a log scan
+    cycle_count = _read_cycle_count()
+    if cycle_count is None:
+        try:
+            with open(autopilot_log, 'r') as f:
+                cycle_count = sum(1 for line in f if "Cycle" in line and "started" in line)
+        except Exception:
+            cycle_count = 0
     
     content = f"""
 [bold {status_color}]Status: {status_text}[/bold {status_color}]
@@ -112,24 +124,51 @@ def _show_logs(lines: int = 50):
     console.print(f"\n[cyan]Last {lines} log entries:[/cyan]\n")
     
     try:
-        with open(log_file, 'r') as f:
-            all_lines = f.readlines()
-            recent = all_lines[-lines:]
-            
-            for line in recent:
-                # Color code by level
-                if "ERROR" in line:
-                    console.print(f"[red]{line.rstrip()}[/red]")
-                elif "WARNING" in line:
-                    console.print(f"[yellow]{line.rstrip()}[/yellow]")
-                elif "INFO" in line:
-                    console.print(f"[dim]{line.rstrip()}[/dim]")
-                else:
-                    console.print(line.rstrip())
+        recent = _tail_lines(log_file, lines)
+        
+        for line in recent:
+            # Color code by level
+            match = LEVEL_RE.search(line)
+            style = LEVEL_STYLES.get(match.group(1)) if match else None
+            if style:
+                console.print(f"[{style}]{line.rstrip()}[/{style}]")
+            else:
+                console.print(line.rstrip())
     except Exception as e:
         console.print(f"[red]Error reading logs: {e}[/red]")
 
 
+def _read_cycle_count() -> int | None:
+    """Return the cycle count persisted by the autopilot service, if available."""
+    try:
+        state = json.loads(AUTOPILOT_STATE_PATH.read_text())
+        return int(state["cycle_count"])
+    except Exception:
+        return None
+
+
+def _tail_lines(path: Path, n: int, block_size: int = 65536) -> list[str]:
+    """Return the last n lines of a file by reading backwards in blocks.
+    
+    Only the tail of the file is read, so large logs aren't loaded into memory.
+    """
+    if n <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        # Need n+1 newlines to be sure the first of the n lines is complete
+        while pos > 0 and data.count(b"\n") <= n:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+    
+    return data.decode("utf-8", errors="replace").splitlines(keepends=True)[-n:]
+
+
 def _show_stats():
     """Show autopilot statistics."""
     
@@ -1,11 +1,12 @@
 """Help command handler for Polly CLI."""
 
-from rich.console import Console
+from typing import Final, Optional
+
 from rich.panel import Panel
 
-console = Console()
+from polly.ui.console import console
 
-HELP_TEXT = """
+HELP_TEXT: Final = """
 [bold cyan]Available Commands:[/bold cyan]
 
   [yellow]/polls [days] [search] [flags][/yellow]  Browse polls with filters
@@ -14,6 +15,7 @@ HELP_TEXT = """
   [yellow]/portfolio[/yellow]                      View trading performance
   [yellow]/trade <market> <outcome> [amt][/yellow] Manually execute trade (real mode only)
   [yellow]/close <trade_id>[/yellow]               Close active position (real mode only)
+  [yellow]/refresh[/yellow]                        Refetch markets (lists are cached ~45s)
   [yellow]/autopilot <cmd>[/yellow]                Monitor/control autopilot service
   [yellow]/help[/yellow]                           Show this help
   [yellow]/exit[/yellow]                           Quit Polly
@@ -66,7 +68,22 @@ HELP_TEXT = """
 """
 
 
+# Rendered panel output, keyed by the console width it was laid out for
+_help_rendered: Optional[tuple[int, str]] = None
+
+
 def handle_help() -> None:
-    """Display help information."""
-    console.print(Panel(HELP_TEXT, title="Polly Help", border_style="green"))
+    """Display help information.
+    
+    The panel is rendered once and the captured output replayed on later
+    calls; it is only re-rendered if the terminal width changes.
+    """
+    global _help_rendered
+    width = console.width
+    if _help_rendered is None or _help_rendered[0] != width:
+        with console.capture() as capture:
+            console.print(Panel(HELP_TEXT, title="Polly Help", border_style="green"))
+        _help_rendered = (width, capture.get())
+    console.file.write(_help_rendered[1])
+    console.file.flush()
 
@@ -2,14 +2,38 @@
 
 import asyncio
 from datetime import datetime, timezone
+from typing import Optional
 
-from rich.console import Console
 from rich.table import Table
 
 from polly.services.polymarket import PolymarketService
+from polly.services.runtime import run_coro
 from polly.storage.research import ResearchRepository
+from polly.ui.console import console
 
-console = Console()
+
+async def _load_records_and_markets(
+    research_repo: ResearchRepository,
+    polymarket: PolymarketService,
+    decision: str,
+    archived_before: Optional[datetime],
+) -> tuple[list[dict], Optional[Exception]]:
+    """Load research rows and warm the market cache concurrently.
+    
+    The market list doesn't depend on which ids the query returns, so the
+    download overlaps the SQLite read; the later id lookup is in-memory.
+    
+    Returns:
+        (records, error from the market fetch or None)
+    """
+    records, markets = await asyncio.gather(
+        asyncio.to_thread(research_repo.list, decision=decision, archived_before=archived_before),
+        polymarket.fetch_all_markets(),
+        return_exceptions=True,
+    )
+    if isinstance(records, BaseException):
+        raise records
+    return records, markets if isinstance(markets, Exception) else None
 
 
 def handle_history(args: str, research_repo: ResearchRepository, polymarket: PolymarketService) -> None:
@@ -28,42 +52,58 @@ def handle_history(args: str, research_repo: ResearchRepository, polymarket: Pol
     
     try:
         # Get research records
-        if status_filter == "all":
-            records = research_repo.list(decision="all")
-        elif status_filter == "completed":
-            records = research_repo.list(decision="decided")
+        archived_before = None
+        if status_filter == "completed":
+            decision = "decided"
         elif status_filter == "pending":
-            records = research_repo.list(decision="undecided")
-        else:  # archived - need to check market expiry
-            records = research_repo.list(decision="all")
+            decision = "undecided"
+        else:  # all / archived - market end date is stored with the research row
+            decision = "all"
+            if status_filter == "archived":
+                archived_before = datetime.now(tz=timezone.utc)
+        
+        # Query the DB while the market list downloads
+        records, warm_error = run_coro(
+            _load_records_and_markets(research_repo, polymarket, decision, archived_before)
+        )
         
         if not records:
             console.print(f"[yellow]No research found for status: {status_filter}[/yellow]")
             return
         
-        # Fetch markets to get questions and check archived status
-        market_ids = [r["market_id"] for r in records]
-        markets_dict = {}
+        # Look up questions in the (now warm) market list
+        # Same market can appear in several research records; look each up once
+        market_ids = list(dict.fromkeys(r["market_id"] for r in records))
+        questions = {}
+        end_dates = {}
         try:
-            markets = asyncio.run(polymarket.fetch_markets_by_ids(market_ids))
-            markets_dict = {m.id: m for m in markets}
+            if warm_error is not None:
+                raise warm_error
+            markets = run_coro(polymarket.fetch_markets_by_ids(market_ids))
+            questions = {m.id: m.question for m in markets}
+            end_dates = {m.id: m.end_date for m in markets}
+            # Backfill end dates for rows researched before they were stored
+            research_repo.record_end_dates(end_dates)
         except Exception as e:
             console.print(f"[yellow]Warning: Could not fetch market details: {e}[/yellow]")
         
-        # Filter for archived status
-        if status_filter == "archived":
-            now = datetime.now(tz=timezone.utc)
+        # Rows without a stored end date were only prefiltered in SQL: check
+        # them against the fetched market as before (unknown markets default
+        # to `now`, which is never < now)
+        if archived_before is not None:
             records = [
                 r for r in records
-                if r["market_id"] in markets_dict and markets_dict[r["market_id"]].end_date < now
+                if r["end_date"] is not None or end_dates.get(r["market_id"], archived_before) < archived_before
             ]
-        
-        if not records:
-            console.print(f"[yellow]No research found for status: {status_filter}[/yellow]")
-            return
+            if not records:
+                console.print(f"[yellow]No research found for status: {status_filter}[/yellow]")
+                return
         
         # Create table
-        table = Table(title=f"Research History ({status_filter.title()})", show_header=True, header_style="bold cyan")
+        table = Table(
+            title=f"Research History ({status_filter.title()})", show_header=True, header_style="bold cyan",
+            show_lines=False, expand=False, pad_edge=False,
+        )
         
         table.add_column("Market ID", style="dim", width=40)
         table.add_column("Question", style="white", width=50)
@@ -73,8 +113,7 @@ def handle_history(args: str, research_repo: ResearchRepository, polymarket: Pol
         
         for record in records:
             market_id = record["market_id"]
-            market = markets_dict.get(market_id)
-            question = market.question if market else market_id
+            question = questions.get(market_id, market_id)
             
             # Truncate question if too long
             if len(question) > 47:
@@ -1,15 +1,75 @@
 """Polls command handler for Polly CLI."""
 
-import asyncio
+import argparse
+from operator import attrgetter
 from typing import List, Union
 
-from rich.console import Console
+from rich.table import Table
 
 from polly.models import Market, MarketGroup
-from polly.services.polymarket import PolymarketService, filter_by_expiry_days
-from polly.ui.formatters import create_polls_table
+from polly.services.polymarket import PolymarketService
+from polly.services.runtime import run_coro
+from polly.ui.console import console
+from polly.ui.formatters import create_polls_table, format_liquidity
 
-console = Console()
+
+class _SortAction(argparse.Action):
+    """Record both the direction (from the flag used) and the column for -asc/-dsc."""
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        namespace.sort_direction = option_string.lstrip('-')
+        namespace.sort_column = values.lower()
+
+
+class _PollsArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that reports errors to the caller instead of exiting the REPL."""
+    
+    def error(self, message):
+        raise ValueError(message)
+
+
+# Built once at import; per-call parsing is a single pass over the tokens
+_POLLS_PARSER = _PollsArgumentParser(prog="/polls", add_help=False, allow_abbrev=False)
+_POLLS_PARSER.add_argument(
+    "-asc", "-dsc", dest="sort_column", action=_SortAction, metavar="column",
+    help="sort by category, question, odds, expires, or liquidity",
+)
+# Kept as text so a non-number gets the friendly message in handle_polls, not argparse's
+_POLLS_PARSER.add_argument("-odds", metavar="max", help="maximum odds (1-99)")
+_POLLS_PARSER.set_defaults(sort_direction=None, sort_column=None)
+_POLLS_FLAGS = frozenset(("-asc", "-dsc", "-odds"))
+# Shown when a flag is missing its value (argparse would consume e.g. "-5")
+_FLAG_VALUE_ERRORS = {
+    "-asc": "Sort flag {flag} requires a column name (category, question, odds, expires, liquidity)",
+    "-dsc": "Sort flag {flag} requires a column name (category, question, odds, expires, liquidity)",
+    "-odds": "-odds flag requires a value (1-99)",
+}
+
+
+def _split_poll_tokens(tokens: List[str]) -> tuple[List[str], List[str]]:
+    """Split tokens into (exact flags with their values, everything else).
+    
+    Only exact flags reach _POLLS_PARSER: argparse would otherwise prefix-match
+    single-dash words such as "-a" and reject them instead of treating them as
+    search text.
+    
+    Raises:
+        ValueError: If a flag has no value after it
+    """
+    flags: List[str] = []
+    rest: List[str] = []
+    i = 0
+    while i < len(tokens):
+        flag = tokens[i].lower()
+        if flag not in _POLLS_FLAGS:
+            rest.append(tokens[i])
+            i += 1
+            continue
+        if i + 1 >= len(tokens) or tokens[i + 1].startswith('-'):
+            raise ValueError(_FLAG_VALUE_ERRORS[flag].format(flag=tokens[i]))
+        flags += (flag, tokens[i + 1])
+        i += 2
+    return flags, rest
 
 
 def handle_polls(args: str, polymarket: PolymarketService) -> List[Union[Market, MarketGroup]]:
@@ -30,40 +90,25 @@ def handle_polls(args: str, polymarket: PolymarketService) -> List[Union[Market,
     max_odds = None
     
     if args.strip():
-        parts = args.strip().split()
-        remaining_parts = []
+        # Flags are case-insensitive; everything else is kept as typed
+        try:
+            flag_tokens, remaining_parts = _split_poll_tokens(args.split())
+            options = _POLLS_PARSER.parse_args(flag_tokens)
+        except ValueError as e:
+            console.print(f"[red]{e}[/red]")
+            return []
         
-        # Extract flags
-        i = 0
-        while i < len(parts):
-            part_lower = parts[i].lower()
-            if part_lower in ('-asc', '-dsc'):
-                sort_direction = 'asc' if part_lower == '-asc' else 'dsc'
-                # Next part should be column name
-                if i + 1 < len(parts) and not parts[i + 1].startswith('-'):
-                    sort_column = parts[i + 1].lower()
-                    i += 2
-                else:
-                    console.print(f"[red]Sort flag {parts[i]} requires a column name (category, question, odds, expires, liquidity)[/red]")
-                    return []
-            elif part_lower == '-odds':
-                # Next part should be max odds value
-                if i + 1 < len(parts) and not parts[i + 1].startswith('-'):
-                    try:
-                        max_odds = int(parts[i + 1])
-                        if max_odds < 1 or max_odds > 99:
-                            console.print("[red]Odds value must be between 1 and 99[/red]")
-                            return []
-                        i += 2
-                    except ValueError:
-                        console.print(f"[red]Invalid odds value: {parts[i + 1]}. Must be a number between 1 and 99.[/red]")
-                        return []
-                else:
-                    console.print("[red]-odds flag requires a value (1-99)[/red]")
-                    return []
-            else:
-                remaining_parts.append(parts[i])
-                i += 1
+        sort_direction = options.sort_direction
+        sort_column = options.sort_column
+        if options.odds is not None:
+            try:
+                max_odds = int(options.odds)
+            except ValueError:
+                console.print(f"[red]Invalid odds value: {options.odds}. Must be a number between 1 and 99.[/red]")
+                return []
+            if max_odds < 1 or max_odds > 99:
+                console.print("[red]Odds value must be between 1 and 99[/red]")
+                return []
         
         # Parse remaining parts: [days] [search_term]
         if remaining_parts:
@@ -85,65 +130,36 @@ def handle_polls(args: str, polymarket: PolymarketService) -> List[Union[Market,
     # Fetch markets and groups
     console.print("[cyan]Fetching markets from Polymarket...[/cyan]")
     try:
-        items = asyncio.run(polymarket.fetch_all_markets())
+        index = run_coro(polymarket.fetch_market_index())
     except Exception as e:
         console.print(f"[red]Error fetching markets: {e}[/red]")
         return []
     
-    if not items:
+    if not index.items:
         console.print("[yellow]No markets found.[/yellow]")
         return []
     
+    # Filters run against the precomputed index columns (positions into index.items)
+    positions = range(len(index.items))
+    
     # Apply time filter if specified
     if days_filter:
-        items = filter_by_expiry_days(items, days_filter)
-        if not items:
+        positions = index.expiring_within(positions, days_filter)
+        if not positions:
             console.print(f"[yellow]No items found expiring within {days_filter} days.[/yellow]")
             return []
     
-    # Apply search filter if specified
+    # Apply search filter if specified (title/question, description, category, tags)
     if search_term:
-        search_lower = search_term.lower()
-        filtered_items = []
-        for item in items:
-            if isinstance(item, MarketGroup):
-                # Search in group title, description, category, and tags
-                if (search_lower in item.title.lower()
-                    or search_lower in item.description.lower()
-                    or search_lower in item.category.lower()
-                    or any(search_lower in tag.lower() for tag in item.tags)):
-                    filtered_items.append(item)
-            else:
-                # Market search (existing logic)
-                if (search_lower in item.question.lower()
-                    or search_lower in item.description.lower()
-                    or search_lower in (item.category or "").lower()
-                    or any(search_lower in tag.lower() for tag in item.tags)):
-                    filtered_items.append(item)
-        items = filtered_items
-        if not items:
+        positions = index.matching(positions, search_term)
+        if not positions:
             console.print(f"[yellow]No items found matching '{search_term}'.[/yellow]")
             return []
     
-    # Apply odds filter if specified
+    # Apply odds filter if specified (groups pass if any market is within threshold)
     if max_odds is not None:
-        max_odds_decimal = max_odds / 100.0
-        filtered_items = []
-        for item in items:
-            if isinstance(item, MarketGroup):
-                # For groups, check if any market has odds within threshold
-                has_valid_odds = any(
-                    max(o.price for o in m.outcomes) <= max_odds_decimal
-                    for m in item.markets if m.outcomes
-                )
-                if has_valid_odds:
-                    filtered_items.append(item)
-            else:
-                # Market (existing logic)
-                if item.outcomes and max(o.price for o in item.outcomes) <= max_odds_decimal:
-                    filtered_items.append(item)
-        items = filtered_items
-        if not items:
+        positions = index.max_odds_at_most(positions, max_odds / 100.0)
+        if not positions:
             console.print(f"[yellow]No items found with maximum odds at or below {max_odds}%.[/yellow]")
             return []
     
@@ -155,29 +171,29 @@ def handle_polls(args: str, polymarket: PolymarketService) -> List[Union[Market,
             console.print(f"[red]Invalid column: {sort_column}. Choose from: {', '.join(valid_columns)}[/red]")
             return []
         
-        # Define sort key based on column (handle both Market and MarketGroup)
+        # Sort positions; numeric columns read precomputed index lists via a C-level key
+        all_items = index.items
         if sort_column == 'category':
-            sort_key = lambda item: (item.category or "").lower()
+            sort_key = lambda i: (all_items[i].category or "").lower()
         elif sort_column == 'question':
-            sort_key = lambda item: (item.title if isinstance(item, MarketGroup) else item.question).lower()
+            # First blob field is the already-casefolded title/question
+            sort_key = lambda i: index.search_blobs[i].partition("\0")[0]
         elif sort_column == 'odds':
             # For groups, use best market odds; for markets, use max odds
-            def odds_key(item):
-                if isinstance(item, MarketGroup):
-                    return max((max(o.price for o in m.outcomes) for m in item.markets if m.outcomes), default=0)
-                else:
-                    return max((o.price for o in item.outcomes), default=0) if item.outcomes else 0
-            sort_key = odds_key
+            sort_key = index.max_prices.__getitem__
         elif sort_column == 'expires':
-            sort_key = lambda item: item.end_date
+            sort_key = index.end_ts.__getitem__
         elif sort_column == 'liquidity':
-            sort_key = lambda item: item.liquidity
+            liquidity = list(map(attrgetter('liquidity'), all_items))
+            sort_key = liquidity.__getitem__
         
         reverse = (sort_direction == 'dsc')
-        items = sorted(items, key=sort_key, reverse=reverse)
+        positions = sorted(positions, key=sort_key, reverse=reverse)
     else:
         # Default: sort by expiry date (soonest first)
-        items = sorted(items, key=lambda item: item.end_date)
+        positions = sorted(positions, key=index.end_ts.__getitem__)
+    
+    items = [index.items[i] for i in positions]
     
     # Display results
     table = create_polls_table(items[:20])  # Limit to top 20
@@ -214,8 +230,6 @@ def show_group_detail(group: MarketGroup, show_all: bool = False) -> None:
         group: The MarketGroup to display
         show_all: If True, show all markets; if False, show top 20
     """
-    from rich.table import Table
-    
     console.print(f"\n[bold cyan]Event:[/bold cyan] {group.title}")
     console.print(f"[dim]{group.description}[/dim]\n" if group.description else "")
     console.print(f"[bold]Category:[/bold] {group.category}")
@@ -226,18 +240,17 @@ def show_group_detail(group: MarketGroup, show_all: bool = False) -> None:
     console.print(f"[bold]Tags:[/bold] {', '.join(group.tags[:5])}\n")
     
     # Create table of all markets
-    table = Table(title=f"All Markets in Event", show_header=True, header_style="bold cyan")
+    table = Table(
+        title="All Markets in Event", show_header=True, header_style="bold cyan",
+        show_lines=False, expand=False, pad_edge=False,
+    )
     table.add_column("Rank", style="dim", width=5)
     table.add_column("Candidate/Option", style="white", width=40)
     table.add_column("Odds", style="yellow", width=10, justify="right")
     table.add_column("Liquidity", style="green", width=12, justify="right")
     
-    # Sort markets by odds (highest first)
-    sorted_markets = sorted(
-        group.markets,
-        key=lambda m: max(o.price for o in m.outcomes) if m.outcomes else 0,
-        reverse=True
-    )
+    # Sort markets by odds (highest first; cached on the group)
+    sorted_markets = group.markets_by_odds
     
     # Show top 20 or all
     markets_to_show = sorted_markets if show_all else sorted_markets[:20]
@@ -249,15 +262,10 @@ def show_group_detail(group: MarketGroup, show_all: bool = False) -> None:
             candidate = candidate[:34] + "..."
         
         # Get Yes probability (winning odds)
-        yes_odds = next((o.price for o in market.outcomes if o.outcome.lower() in ('yes', 'y')), 0.0)
+        yes_odds = market.yes_price
         
         # Format liquidity
-        if market.liquidity >= 1_000_000:
-            liq_str = f"${market.liquidity/1_000_000:.2f}M"
-        elif market.liquidity >= 1_000:
-            liq_str = f"${market.liquidity/1_000:.1f}k"
-        else:
-            liq_str = f"${market.liquidity:.0f}"
+        liq_str = format_liquidity(market.liquidity, precise=True)
         
         table.add_row(
             str(i),
@@ -271,4 +279,3 @@ def show_group_detail(group: MarketGroup, show_all: bool = False) -> None:
     if not show_all and len(group.markets) > 20:
         console.print(f"\n[dim]Showing top 20 of {len(group.markets)} markets[/dim]")
         console.print(f"[dim]Note: Full list view coming soon[/dim]")
-
@@ -1,12 +1,19 @@
 """Portfolio command handler for Polly CLI."""
 
+import time
+import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Optional
 
-from rich.console import Console
+from rich.console import Group, RenderableType
 
 from polly.config import TradingConfig
+from polly.models import PortfolioSnapshot, Trade
 from polly.services.trading import TradingService
 from polly.storage.trades import TradeRepository
+from polly.ui.console import console
 from polly.ui.formatters import (
     create_portfolio_panel,
     create_active_positions_table,
@@ -14,7 +21,26 @@ from polly.ui.formatters import (
     create_grouped_position_display,
 )
 
-console = Console()
+# Rendered output is replayed for identical data within this window; the
+# positions table shows days left, so the output can't be reused forever
+RENDER_TTL_SECONDS = 60
+
+# (fingerprint, rendered at, captured output) of the last successful render
+_portfolio_rendered: Optional[tuple[tuple[int, str], float, str]] = None
+
+
+@dataclass(slots=True)
+class _PortfolioData:
+    """Everything the portfolio view shows, loaded before any rendering."""
+
+    mode: str
+    has_trading_service: bool
+    snapshot: PortfolioSnapshot
+    recent_trades: list[Trade]
+    balances: Optional[dict] = None
+    balances_error: Optional[BaseException] = None
+    live_positions: list[dict] = field(default_factory=list)
+    live_error: Optional[BaseException] = None
 
 
 def handle_portfolio(
@@ -23,120 +49,174 @@ def handle_portfolio(
     trading_service: Optional[TradingService] = None,
 ) -> None:
     """Handle /portfolio command.
-    
+
+    If the loaded data and terminal width match the previous call (within
+    RENDER_TTL_SECONDS), the captured output is replayed instead of
+    re-rendering every panel and table.
+
     Args:
         trade_repo: Trade repository instance
         trading_config: Trading configuration
         trading_service: Trading service (for real mode balance display)
     """
+    global _portfolio_rendered
     try:
-        # Display trading mode indicator
-        mode_badge = "[green]PAPER MODE[/green]" if trading_config.mode == "paper" else "[red]REAL MODE[/red]"
-        console.print(f"\n{mode_badge}")
-        console.print(f"[dim]Showing {trading_config.mode} trades only[/dim]\n")
-        
-        # Get real balance if in real mode
-        real_balance = None
-        if trading_config.mode == "real" and trading_service:
-            try:
-                balances = trading_service.get_balances()
-                if "error" not in balances:
-                    real_balance = balances.get("usdc", 0.0)
-            except Exception:
-                pass
-        
-        # Get portfolio metrics filtered by current mode
-        metrics = trade_repo.metrics(
-            starting_cash=trading_config.starting_cash,
-            filter_mode=trading_config.mode,
-            real_balance=real_balance
-        )
-        
-        # Display metrics panel
-        panel = create_portfolio_panel(metrics)
-        console.print(panel)
-        
-        # If real mode and trading service available, show actual balances
-        if trading_config.mode == "real":
-            if trading_service:
-                console.print("\n[bold cyan]On-Chain Balances:[/bold cyan]")
-                try:
-                    balances = trading_service.get_balances()
-                    if "error" in balances:
-                        console.print(f"  [yellow]Error: {balances['error']}[/yellow]")
-                    else:
-                        # Display all balance info
-                        usdc_balance = balances.get("usdc", 0.0)
-                        console.print(f"  USDC: ${usdc_balance:,.2f}")
-                        
-                        # Show raw balance data for debugging if needed
-                        if usdc_balance == 0:
-                            console.print(f"  [dim](Raw data: {balances})[/dim]")
-                except Exception as e:
-                    console.print(f"  [yellow]Could not fetch: {e}[/yellow]")
-                    import traceback
-                    console.print(f"  [dim]{traceback.format_exc()}[/dim]")
-            else:
-                console.print("\n[yellow]⚠️  POLYGON_PRIVATE_KEY not set - cannot fetch on-chain balances[/yellow]")
-                console.print("[dim]Add POLYGON_PRIVATE_KEY to .env to enable balance checking[/dim]")
-        
-        # Display active positions (filtered by current mode)
-        active_trades = trade_repo.list_active(filter_mode=trading_config.mode)
-        
-        # For real mode, enrich with live Polymarket data
-        live_positions = []
-        if trading_config.mode == "real" and trading_service:
-            try:
-                live_positions = trading_service.get_live_positions()
-            except Exception as e:
-                console.print(f"[dim]Could not fetch live positions: {e}[/dim]")
-        
-        if active_trades:
-            console.print()
-            
-            # Separate grouped and ungrouped positions
-            grouped_trades = {}
-            ungrouped_trades = []
-            
-            for trade in active_trades:
-                if trade.is_grouped and trade.event_id:
-                    if trade.event_id not in grouped_trades:
-                        grouped_trades[trade.event_id] = []
-                    grouped_trades[trade.event_id].append(trade)
-                else:
-                    ungrouped_trades.append(trade)
-            
-            # Display grouped positions first
-            if grouped_trades:
-                console.print("[bold cyan]Grouped Event Positions:[/bold cyan]\n")
-                for event_id, trades in grouped_trades.items():
-                    event_title = trades[0].event_title or "Unknown Event"
-                    panel = create_grouped_position_display(event_id, event_title, trades)
-                    console.print(panel)
-                    console.print()
-            
-            # Display ungrouped positions
-            if ungrouped_trades:
-                if grouped_trades:
-                    console.print("[bold cyan]Individual Positions:[/bold cyan]\n")
-                table = create_active_positions_table(ungrouped_trades, live_positions)
-                console.print(table)
-        else:
-            console.print("\n[dim]No active positions[/dim]")
-        
-        # Display recent trades
-        recent_trades = [t for t in metrics.recent_trades if t.status in ("won", "lost", "closed")]
-        if recent_trades:
-            console.print()
-            table = create_recent_trades_table(recent_trades)
-            console.print(table)
-        else:
-            console.print("\n[dim]No completed trades yet[/dim]")
-        
-        # Display cash balances (paper tracking)
-        console.print(f"\n[bold]Tracked Cash Available:[/bold] ${metrics.cash_available:,.2f}")
-        console.print(f"[bold]Cash In Play:[/bold] ${metrics.cash_in_play:,.2f}")
-        
+        data = _load_portfolio(trade_repo, trading_config, trading_service)
+
+        fingerprint = (console.width, repr(data))
+        now = time.monotonic()
+        if (
+            _portfolio_rendered is None
+            or _portfolio_rendered[0] != fingerprint
+            or now - _portfolio_rendered[1] > RENDER_TTL_SECONDS
+        ):
+            # Collected and rendered as one Group so Rich lays out/flushes once
+            with console.capture() as capture:
+                console.print(Group(*_portfolio_renderables(data)))
+            _portfolio_rendered = (fingerprint, now, capture.get())
+        console.file.write(_portfolio_rendered[2])
+        console.file.flush()
+
     except Exception as e:
         console.print(f"[red]Error loading portfolio: {e}[/red]")
+        console.print(f"[dim]{traceback.format_exc(limit=-3)}[/dim]")
+
+
+def _load_portfolio(
+    trade_repo: TradeRepository,
+    trading_config: TradingConfig,
+    trading_service: Optional[TradingService],
+) -> _PortfolioData:
+    """Fetch balances, positions and trades for the current trading mode."""
+    # Independent RPCs run concurrently (real mode only): on-chain balances
+    # and live positions; the DB snapshot below overlaps the positions call
+    real_service = trading_service if trading_config.mode == "real" else None
+    pool = ThreadPoolExecutor(max_workers=2)
+    balances_future = pool.submit(real_service.get_balances) if real_service else None
+    live_future = pool.submit(real_service.get_live_positions) if real_service else None
+    pool.shutdown(wait=False)
+
+    # Get real balance if in real mode (fetched once, reused for on-chain display)
+    real_balance = None
+    balances = None
+    balances_error = None
+    if balances_future is not None:
+        try:
+            balances = balances_future.result()
+            if "error" not in balances:
+                real_balance = balances.get("usdc", 0.0)
+        except Exception as e:
+            balances_error = e
+
+    # Get portfolio metrics and active positions filtered by current mode
+    snapshot = trade_repo.portfolio_snapshot(
+        starting_cash=trading_config.starting_cash,
+        filter_mode=trading_config.mode,
+        real_balance=real_balance
+    )
+
+    # Recent completed trades (status/mode filtered in SQL)
+    recent_trades = trade_repo.list_history(limit=5, filter_mode=trading_config.mode)
+
+    # For real mode, enrich with live Polymarket data
+    live_positions = []
+    live_error = None
+    if live_future is not None:
+        try:
+            live_positions = live_future.result()
+        except Exception as e:
+            live_error = e
+
+    return _PortfolioData(
+        mode=trading_config.mode,
+        has_trading_service=trading_service is not None,
+        snapshot=snapshot,
+        recent_trades=recent_trades,
+        balances=balances,
+        balances_error=balances_error,
+        live_positions=live_positions,
+        live_error=live_error,
+    )
+
+
+def _portfolio_renderables(data: _PortfolioData) -> list[RenderableType]:
+    """Build the portfolio view, in display order."""
+    out: list[RenderableType] = []
+    metrics = data.snapshot.metrics
+
+    # Display trading mode indicator
+    mode_badge = "[green]PAPER MODE[/green]" if data.mode == "paper" else "[red]REAL MODE[/red]"
+    out.append(f"\n{mode_badge}")
+    out.append(f"[dim]Showing {data.mode} trades only[/dim]\n")
+
+    # Display metrics panel
+    out.append(create_portfolio_panel(metrics))
+
+    # If real mode and trading service available, show actual balances
+    if data.mode == "real":
+        if data.has_trading_service:
+            out.append("\n[bold cyan]On-Chain Balances:[/bold cyan]")
+            if data.balances_error is not None:
+                out.append(f"  [yellow]Could not fetch: {data.balances_error}[/yellow]")
+                formatted = "".join(traceback.format_exception(data.balances_error))
+                out.append(f"  [dim]{formatted}[/dim]")
+            elif "error" in data.balances:
+                out.append(f"  [yellow]Error: {data.balances['error']}[/yellow]")
+            else:
+                # Display all balance info
+                usdc_balance = data.balances.get("usdc", 0.0)
+                out.append(f"  USDC: ${usdc_balance:,.2f}")
+
+                # Show raw balance data for debugging if needed
+                if usdc_balance == 0:
+                    out.append(f"  [dim](Raw data: {data.balances})[/dim]")
+        else:
+            out.append("\n[yellow]⚠️  POLYGON_PRIVATE_KEY not set - cannot fetch on-chain balances[/yellow]")
+            out.append("[dim]Add POLYGON_PRIVATE_KEY to .env to enable balance checking[/dim]")
+
+    if data.live_error is not None:
+        out.append(f"[dim]Could not fetch live positions: {data.live_error}[/dim]")
+
+    # Display active positions (filtered by current mode)
+    active_trades = data.snapshot.active_trades
+    if active_trades:
+        out.append("")
+
+        # Separate grouped and ungrouped positions
+        grouped_trades = defaultdict(list)
+        ungrouped_trades = []
+
+        for trade in active_trades:
+            if trade.is_grouped and trade.event_id:
+                grouped_trades[trade.event_id].append(trade)
+            else:
+                ungrouped_trades.append(trade)
+
+        # Display grouped positions first
+        if grouped_trades:
+            out.append("[bold cyan]Grouped Event Positions:[/bold cyan]\n")
+            for event_id, trades in grouped_trades.items():
+                event_title = trades[0].event_title or "Unknown Event"
+                out.append(create_grouped_position_display(event_id, event_title, trades))
+                out.append("")
+
+        # Display ungrouped positions
+        if ungrouped_trades:
+            if grouped_trades:
+                out.append("[bold cyan]Individual Positions:[/bold cyan]\n")
+            out.append(create_active_positions_table(ungrouped_trades, data.live_positions))
+    else:
+        out.append("\n[dim]No active positions[/dim]")
+
+    # Display recent trades
+    if data.recent_trades:
+        out.append("")
+        out.append(create_recent_trades_table(data.recent_trades))
+    else:
+        out.append("\n[dim]No completed trades yet[/dim]")
+
+    # Display cash balances (paper tracking)
+    out.append(f"\n[bold]Tracked Cash Available:[/bold] ${metrics.cash_available:,.2f}")
+    out.append(f"[bold]Cash In Play:[/bold] ${metrics.cash_in_play:,.2f}")
 
+    return out
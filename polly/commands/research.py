@@ -1,27 +1,143 @@
 """Research command handler for Polly CLI."""
 
-import asyncio
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List
 
-from rich.console import Console
 from rich.live import Live
 from rich.panel import Panel
 from rich.prompt import Confirm
+from rich.style import Style
+from rich.text import Text
 
-from polly.commands.trade import get_available_balance, prompt_for_amount
+from polly.commands.trade import (
+    REAL_TRADE_PANEL,
+    get_available_balance,
+    invalidate_balance_cache,
+    prompt_for_amount,
+)
 from polly.config import TradingConfig, ResearchConfig
 from polly.models import Market, MarketGroup, ResearchProgress, ResearchResult, Trade
 from polly.services.evaluator import PositionEvaluator
 from polly.services.polymarket import PolymarketService
 from polly.services.research import ResearchService, calculate_optimal_rounds
+from polly.services.runtime import run_coro
 from polly.services.trading import TradingService
-from polly.services.validators import check_usdc_balance, validate_market_active
 from polly.storage.research import ResearchRepository
 from polly.storage.trades import TradeRepository
+from polly.ui.console import console
 from polly.ui.formatters import format_payout
 
-console = Console()
+# Progress messages kept (and shown) in the live research panel
+PROGRESS_LINES = 15
+# Live repaints (and rebuilds the progress panel) this often
+LIVE_REFRESH_PER_SECOND = 2
+
+# Research rows are written here while the results panel renders; one worker
+# keeps writes ordered (repositories open a connection per call)
+_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="polly-research-io")
+
+# Parsed once; the progress panel is rebuilt on every Live refresh
+_PROGRESS_BORDER_STYLE = Style.parse("cyan")
+
+# (marker, style, is_prefix) for progress lines, first match wins; others are dim
+_MARKET_PROGRESS_STYLES = (
+    ("Round", "cyan", True),
+    ("📎 Found:", "green", False),
+    ("Thinking...", "yellow", False),
+    ("Usage so far:", "magenta", False),
+)
+_GROUP_PROGRESS_STYLES = (
+    ("Round", "cyan", True),
+    ("🔍", "green", False),
+)
+
+# Fixed trade prompt renderables, built (and their markup parsed) once at import
+_PAPER_TRADE_PANEL = Panel(Text.from_markup("[bold green]PAPER TRADE[/bold green]"), style="green")
+_TRADE_CANCELLED = Text("Trade cancelled.", style="yellow")
+
+# Fixed lines of the group research results panel
+_ANALYZE_ONLY_LINE = "   [yellow]○ Analyze only (no entry suggested)[/yellow]\n"
+_NO_RECOMMENDATIONS_TEXT = (
+    "[yellow]No specific recommendations generated yet.[/yellow]\n"
+    "[dim]This feature is under development.[/dim]\n"
+)
+
+
+class _ProgressView:
+    """Research progress collected from callbacks and rendered on Live's refresh tick.
+    
+    The callback only records state; Live calls render() at
+    LIVE_REFRESH_PER_SECOND, so bursts of events cost one panel build per
+    repaint instead of one per event.
+    """
+    
+    def __init__(
+        self,
+        title: str,
+        initial: str,
+        done_message: str,
+        styles: tuple[tuple[str, str, bool], ...],
+        citation_marker: str | None = None,
+    ) -> None:
+        self._title = title
+        self._initial = initial
+        self._done_message = done_message
+        self._styles = styles
+        self._citation_marker = citation_marker
+        # Research callbacks run on the runtime loop thread, render() on Live's
+        self._lock = threading.Lock()
+        # Progress lines, already wrapped in their style markup
+        self._messages: deque[str] = deque(maxlen=PROGRESS_LINES)
+        self._latest: ResearchProgress | None = None
+        self._citations = 0
+        # Bumped per event; render() reuses the last panel while it's unchanged
+        self._version = 0
+        self._rendered: tuple[int, Panel] | None = None
+    
+    def update(self, progress: ResearchProgress) -> None:
+        """Callback for research progress updates."""
+        # Classified once here, not again for every panel that shows it
+        line = self._format_line(progress.message)
+        with self._lock:
+            self._messages.append(line)
+            self._latest = progress
+            if self._citation_marker and self._citation_marker in progress.message:
+                self._citations += 1
+            self._version += 1
+    
+    def render(self) -> Panel:
+        with self._lock:
+            version = self._version
+            if self._rendered is not None and self._rendered[0] == version:
+                return self._rendered[1]
+            lines = list(self._messages)
+            progress = self._latest
+            citations = self._citations
+        if progress is None:
+            return Panel(self._initial, title="Research Progress")
+        
+        lines.append(f"\n[bold]Round {progress.round_number}/{progress.total_rounds}[/bold]")
+        if citations > 0:
+            lines[-1] += f" | [green]{citations} citations found[/green]"
+        if progress.completed:
+            lines.append(f"\n[green]✓ {self._done_message}[/green]")
+        # Markup parsed once here, not on each repaint of the cached panel
+        panel = Panel(
+            Text.from_markup("\n".join(lines)), title=self._title, border_style=_PROGRESS_BORDER_STYLE
+        )
+        self._rendered = (version, panel)
+        return panel
+    
+    def _format_line(self, msg: str) -> str:
+        for marker, style, is_prefix in self._styles:
+            if msg.startswith(marker) if is_prefix else marker in msg:
+                return f"[{style}]{msg}[/{style}]"
+        return f"[dim]{msg}[/dim]"
 
 
 def handle_research(
@@ -51,20 +167,19 @@ def handle_research(
         trading_service: Trading service (required for real trading)
     """
     # Parse poll ID
-    if not args.strip():
+    poll_arg = args.strip()
+    if not poll_arg:
         console.print("[red]Error: Poll ID required. Usage: /research <poll_id>[/red]")
         return
     
-    try:
-        poll_idx = int(args.strip()) - 1  # Convert to 0-based index
-        if poll_idx < 0:
-            raise ValueError("Poll ID must be positive")
-    except ValueError:
+    # isascii: str.isdigit also accepts digits int() can't parse (e.g. "²")
+    if not (poll_arg.isascii() and poll_arg.isdigit()) or int(poll_arg) == 0:
         console.print(f"[red]Invalid poll ID: {args}. Expected a number from the polls list.[/red]")
         return
+    poll_idx = int(poll_arg) - 1  # Convert to 0-based index
     
     # Get item from cache
-    if 0 <= poll_idx < len(markets_cache):
+    if poll_idx < len(markets_cache):
         item = markets_cache[poll_idx]
     else:
         console.print(f"[yellow]Poll #{poll_idx + 1} not in cache. Run /polls first to see available items.[/yellow]")
@@ -90,10 +205,19 @@ def handle_research(
     console.print(f"[dim]Market ID: {market.id}[/dim]\n")
     
     # Check if research already exists
-    existing = research_repo.get_by_market_id(market.id)
+    existing = research_repo.get_with_decision(market.id)
     if existing:
+        result, edge, recommendation, decision = existing
+        
+        # Already decided: nothing to act on, so skip the full results panel
+        if decision:
+            console.print(
+                f"[yellow]Already researched:[/yellow] {result.prediction} {result.probability:.0%} "
+                f"| Edge {edge:+.1%} | {recommendation.upper()} [dim]| Previous decision: {decision}[/dim]"
+            )
+            return
+        
         console.print("[yellow]Research already exists for this market. Displaying cached results...[/yellow]\n")
-        result, edge, recommendation = existing
         
         # Display cached results
         _display_research_result(
@@ -104,14 +228,13 @@ def handle_research(
             trading_config=trading_config,
         )
         
-        # Check if user already made a decision
-        decision = research_repo.get_decision(market.id)
-        if decision:
-            console.print(f"\n[dim]Previous decision: {decision}[/dim]")
-            return
-        
-        # Prompt for trade if recommendation is enter
+        # Prompt for trade if recommendation is enter. Ask first: reopening
+        # cached research is often just a review, and the trade prompt fetches
+        # the balance (a wallet RPC in real mode) before anything is entered.
         if recommendation == "enter":
+            if not Confirm.ask("Enter a trade on this research?", default=True):
+                console.print("[dim]No trade entered; research stays undecided.[/dim]")
+                return
             _prompt_for_trade(
                 market=market,
                 result=result,
@@ -119,61 +242,28 @@ def handle_research(
                 trade_repo=trade_repo,
                 trading_config=trading_config,
                 trading_service=trading_service,
+                entry_confirmed=True,
             )
         return
     
     # Run new research
     console.print("[cyan]Starting deep research...[/cyan]\n")
     
-    progress_messages = []
-    citation_count = 0
-    
-    def progress_callback(progress: ResearchProgress) -> None:
-        """Callback for research progress updates."""
-        progress_messages.append(progress.message)
+    view = _ProgressView(
+        title="Research Progress",
+        initial="Initializing research...",
+        done_message="Research complete!",
+        styles=_MARKET_PROGRESS_STYLES,
+        citation_marker="📎 Found:",
+    )
     
     # Run research with live progress display
-    with Live(Panel("Initializing research...", title="Research Progress"), refresh_per_second=4) as live:
-        def update_callback(progress: ResearchProgress) -> None:
-            nonlocal citation_count
-            progress_callback(progress)
-            
-            # Count citations
-            if "📎 Found:" in progress.message:
-                citation_count += 1
-            
-            # Show last 15 messages for better context
-            recent = progress_messages[-15:]
-            
-            # Format messages - highlight tool calls and citations
-            formatted_messages = []
-            for msg in recent:
-                if msg.startswith("Round"):
-                    formatted_messages.append(f"[cyan]{msg}[/cyan]")
-                elif "📎 Found:" in msg:
-                    formatted_messages.append(f"[green]{msg}[/green]")
-                elif "Thinking..." in msg:
-                    formatted_messages.append(f"[yellow]{msg}[/yellow]")
-                elif "Usage so far:" in msg:
-                    formatted_messages.append(f"[magenta]{msg}[/magenta]")
-                else:
-                    formatted_messages.append(f"[dim]{msg}[/dim]")
-            
-            content = "\n".join(formatted_messages)
-            content += f"\n\n[bold]Round {progress.round_number}/{progress.total_rounds}[/bold]"
-            
-            if citation_count > 0:
-                content += f" | [green]{citation_count} citations found[/green]"
-            
-            if progress.completed:
-                content += "\n\n[green]✓ Research complete![/green]"
-            
-            live.update(Panel(content, title="Research Progress", border_style="cyan"))
-        
+    # Redirected output: no refresh thread, Live renders the final state once on exit
+    with Live(get_renderable=view.render, refresh_per_second=LIVE_REFRESH_PER_SECOND, auto_refresh=console.is_terminal):
         try:
-            result = asyncio.run(research_service.conduct_research(
+            result = run_coro(research_service.conduct_research(
                 market=market,
-                callback=update_callback,
+                callback=view.update,
             ))
         except Exception as e:
             console.print(f"\n[red]Research failed: {e}[/red]")
@@ -184,11 +274,13 @@ def handle_research(
     # Evaluate position
     evaluation = evaluator.evaluate(market, result)
     
-    # Store research results
-    research_repo.upsert_result(
+    # Store research results in the background while they're displayed
+    stored = _io_pool.submit(
+        research_repo.upsert_result,
         result=result,
         eval_edge=evaluation.edge,
         eval_recommendation=evaluation.recommendation,
+        market_end_date=market.end_date,
     )
     
     # Display results
@@ -200,6 +292,9 @@ def handle_research(
         trading_config=trading_config,
     )
     
+    # The decision written below updates the stored row, so it must exist first
+    stored.result()
+    
     # Prompt for trade if recommendation is enter
     if evaluation.recommendation == "enter":
         _prompt_for_trade(
@@ -224,36 +319,37 @@ def _display_research_result(
     """Display research results in a formatted panel."""
     
     # Build content
-    content = f"[bold]Prediction:[/bold] {result.prediction}\n"
-    content += f"[bold]Probability:[/bold] {result.probability:.0%}\n"
-    content += f"[bold]Confidence:[/bold] {int(result.confidence)}%\n"
-    content += f"[bold]Edge vs Market:[/bold] {edge:+.1%}\n\n"
-    content += f"[bold]Rationale:[/bold]\n{result.rationale}\n\n"
+    parts = [
+        f"[bold]Prediction:[/bold] {result.prediction}\n",
+        f"[bold]Probability:[/bold] {result.probability:.0%}\n",
+        f"[bold]Confidence:[/bold] {int(result.confidence)}%\n",
+        f"[bold]Edge vs Market:[/bold] {edge:+.1%}\n\n",
+        f"[bold]Rationale:[/bold]\n{result.rationale}\n\n",
+    ]
     
     if result.key_findings:
-        content += f"[bold]Key Findings:[/bold]\n"
-        for finding in result.key_findings[:5]:  # Show top 5
-            content += f"  • {finding}\n"
-        content += "\n"
+        parts.append("[bold]Key Findings:[/bold]\n")
+        parts.extend(f"  • {finding}\n" for finding in result.key_findings[:5])  # Show top 5
+        parts.append("\n")
     
     # Cost info if available
     if result.estimated_cost_usd:
-        content += f"[dim]Research cost: ${result.estimated_cost_usd:.4f} | Duration: {result.duration_minutes} min[/dim]\n"
+        parts.append(f"[dim]Research cost: ${result.estimated_cost_usd:.4f} | Duration: {result.duration_minutes} min[/dim]\n")
     
     # Recommendation
     if recommendation == "enter":
-        market_odds = market.formatted_odds()
+        market_odds = market.price_by_outcome
         odds = market_odds.get(result.prediction, 0.5)
         payout_str = format_payout(trading_config.default_stake, odds)
         
-        content += f"\n[bold green]RECOMMENDATION: ENTER[/bold green]\n"
-        content += f"Bet on: {result.prediction} at {odds:.0%}\n"
-        content += f"Potential payout for ${trading_config.default_stake:.0f}: {payout_str}"
+        parts.append("\n[bold green]RECOMMENDATION: ENTER[/bold green]\n")
+        parts.append(f"Bet on: {result.prediction} at {odds:.0%}\n")
+        parts.append(f"Potential payout for ${trading_config.default_stake:.0f}: {payout_str}")
     else:
-        content += f"\n[bold yellow]RECOMMENDATION: PASS[/bold yellow]\n"
-        content += "Edge or confidence threshold not met."
+        parts.append("\n[bold yellow]RECOMMENDATION: PASS[/bold yellow]\n")
+        parts.append("Edge or confidence threshold not met.")
     
-    console.print(Panel(content, title="Research Results", border_style="green"))
+    console.print(Panel("".join(parts), title="Research Results", border_style="green"))
 
 
 def _prompt_for_trade(
@@ -263,27 +359,29 @@ def _prompt_for_trade(
     trade_repo: TradeRepository,
     trading_config: TradingConfig,
     trading_service: TradingService | None,
+    entry_confirmed: bool = False,
 ) -> None:
-    """Prompt user to enter trade (paper or real based on config)."""
+    """Prompt user to enter trade (paper or real based on config).
+    
+    entry_confirmed: the user already agreed to trade, so paper mode skips
+    its own confirmation (real mode still asks before spending money).
+    """
     
     # Determine trading mode
     is_real_mode = trading_config.mode == "real"
     
-    # Get current odds
-    market_odds = market.formatted_odds()
-    odds = market_odds.get(result.prediction, 0.5)
-    
     # Find the outcome token
-    outcome_token = None
-    for outcome in market.outcomes:
-        if outcome.outcome == result.prediction:
-            outcome_token = outcome
-            break
+    outcome_token = market.outcome_by_name.get(result.prediction.lower())
     
     if not outcome_token:
         console.print("[red]Error: Could not find outcome token[/red]")
         return
     
+    # Price and label come from the token itself (the match is case-insensitive),
+    # so the trade is priced and stored under the market's own outcome label
+    odds = outcome_token.price
+    selected_option = outcome_token.outcome
+    
     # Get available balance
     available_balance = get_available_balance(trading_config, trade_repo, trading_service)
     
@@ -292,16 +390,18 @@ def _prompt_for_trade(
         available_balance=available_balance,
         default_stake=trading_config.default_stake,
         market_question=market.question,
-        outcome_name=result.prediction,
+        outcome_name=selected_option,
         outcome_price=odds,
         is_real_mode=is_real_mode,
     )
     
     if amount is None:
-        console.print("[yellow]Trade cancelled.[/yellow]")
+        console.print(_TRADE_CANCELLED)
         research_repo.set_decision(market.id, "pass")
         return
     
+    expires = market.end_date.strftime('%Y-%m-%d')
+    
     # Handle real trading mode
     if is_real_mode:
         if not trading_service:
@@ -309,9 +409,9 @@ def _prompt_for_trade(
             return
         
         # Final confirmation for real money
-        console.print(Panel(f"[bold red]⚠️  REAL MONEY TRADE[/bold red]", style="red"))
+        console.print(REAL_TRADE_PANEL)
         if not Confirm.ask("Execute real trade?", default=False):
-            console.print("[yellow]Trade cancelled.[/yellow]")
+            console.print(_TRADE_CANCELLED)
             research_repo.set_decision(market.id, "pass")
             return
         
@@ -328,72 +428,72 @@ def _prompt_for_trade(
             return
         
         # Create trade record with real execution details
-        trade = Trade(
-            id=None,
-            market_id=market.id,
-            question=market.question,
-            category=market.category,
-            selected_option=result.prediction,
-            entry_odds=trade_result.executed_price,
-            stake_amount=amount,
-            entry_timestamp=datetime.now(tz=timezone.utc),
-            predicted_probability=result.probability,
-            confidence=result.confidence,
-            research_id=None,
-            status="active",
-            resolves_at=market.end_date,
-            actual_outcome=None,
-            profit_loss=None,
-            closed_at=None,
-            trade_mode="real",
+        trade = _build_trade(
+            market, result, selected_option, amount, trade_result.executed_price, "real",
             order_id=trade_result.order_id,
         )
         
-        saved_trade = trade_repo.record_trade(trade)
-        research_repo.set_decision(market.id, "enter")
+        saved_trade = trade_repo.record_trade_and_decision(trade, market.id, "enter")
+        invalidate_balance_cache()
         
         console.print(f"\n[green]✓ REAL trade executed! Position ID: {saved_trade.id}[/green]")
         console.print(f"[dim]Order ID: {trade_result.order_id}[/dim]")
         console.print(f"[dim]Executed Price: ${trade_result.executed_price:.3f}[/dim]")
         console.print(f"[dim]Shares: {trade_result.executed_size:.2f}[/dim]")
-        console.print(f"[dim]Stake: ${amount:.2f} | Expires: {market.end_date.strftime('%Y-%m-%d')}[/dim]")
+        console.print(f"[dim]Stake: ${amount:.2f} | Expires: {expires}[/dim]")
     
     else:
-        # Paper trading mode - confirm with simple yes/no
-        console.print(Panel(f"[bold green]PAPER TRADE[/bold green]", style="green"))
-        if not Confirm.ask("Enter paper trade?", default=True):
-            console.print("[yellow]Trade cancelled.[/yellow]")
+        # Paper trading mode - confirm with simple yes/no (unless already confirmed)
+        console.print(_PAPER_TRADE_PANEL)
+        if not entry_confirmed and not Confirm.ask("Enter paper trade?", default=True):
+            console.print(_TRADE_CANCELLED)
             research_repo.set_decision(market.id, "pass")
             return
         
         # Paper trading
-        trade = Trade(
-            id=None,
-            market_id=market.id,
-            question=market.question,
-            category=market.category,
-            selected_option=result.prediction,
-            entry_odds=odds,
-            stake_amount=amount,
-            entry_timestamp=datetime.now(tz=timezone.utc),
-            predicted_probability=result.probability,
-            confidence=result.confidence,
-            research_id=None,
-            status="active",
-            resolves_at=market.end_date,
-            actual_outcome=None,
-            profit_loss=None,
-            closed_at=None,
-            trade_mode="paper",
-            order_id=None,
-        )
+        trade = _build_trade(market, result, selected_option, amount, odds, "paper")
         
         # Record paper trade
-        saved_trade = trade_repo.record_trade(trade)
-        research_repo.set_decision(market.id, "enter")
+        saved_trade = trade_repo.record_trade_and_decision(trade, market.id, "enter")
+        invalidate_balance_cache()
         
         console.print(f"\n[green]✓ Paper trade recorded! Position ID: {saved_trade.id}[/green]")
-        console.print(f"[dim]Stake: ${trade.stake_amount:.2f} | Odds: {odds:.0%} | Expires: {market.end_date.strftime('%Y-%m-%d')}[/dim]")
+        console.print(f"[dim]Stake: ${trade.stake_amount:.2f} | Odds: {odds:.0%} | Expires: {expires}[/dim]")
+
+
+def _build_trade(
+    market: Market,
+    result: ResearchResult,
+    selected_option: str,
+    amount: float,
+    entry_odds: float,
+    trade_mode: str,
+    order_id: str | None = None,
+) -> Trade:
+    """Build a new active trade on a researched market (paper or real).
+    
+    selected_option is the market's outcome label for the predicted side.
+    """
+    return Trade(
+        id=None,
+        market_id=market.id,
+        question=market.question,
+        category=market.category,
+        selected_option=selected_option,
+        entry_odds=entry_odds,
+        stake_amount=amount,
+        entry_timestamp=datetime.now(tz=timezone.utc),
+        predicted_probability=result.probability,
+        confidence=result.confidence,
+        research_id=None,
+        status="active",
+        resolves_at=market.end_date,
+        actual_outcome=None,
+        profit_loss=None,
+        closed_at=None,
+        trade_mode=trade_mode,
+        order_id=order_id,
+    )
 
 
 def _handle_group_research(
@@ -416,7 +516,7 @@ def _handle_group_research(
     top_markets = group.get_top_markets(10)
     for i, market in enumerate(top_markets, 1):
         # Get Yes probability (winning chance)
-        yes_prob = next((o.price for o in market.outcomes if o.outcome.lower() in ('yes', 'y')), 0.0)
+        yes_prob = market.yes_price
         candidate = market.question.split("Will ")[-1].split(" win")[0] if "Will " in market.question else market.question[:40]
         console.print(f"  {i}. {candidate}: {yes_prob:.1%}")
     
@@ -426,18 +526,21 @@ def _handle_group_research(
         console.print()
     
     # Check if research already exists
-    existing = research_repo.get_by_market_id(group.id)
+    existing = research_repo.get_with_decision(group.id)
     if existing:
-        console.print("[yellow]Research already exists for this event. Displaying cached results...[/yellow]\n")
-        result, edge, recommendation = existing
-        _display_group_research_result(group, result, trading_config)
+        result, edge, recommendation, decision = existing
         
-        # Check if user already made a decision
-        decision = research_repo.get_decision(group.id)
+        # Already decided: nothing to act on, so skip the full results panel
         if decision:
-            console.print(f"\n[dim]Previous decision: {decision}[/dim]")
+            console.print(
+                f"[yellow]Already researched:[/yellow] {result.prediction} {result.probability:.0%} "
+                f"| Confidence {int(result.confidence)}% [dim]| Previous decision: {decision}[/dim]"
+            )
             return
         
+        console.print("[yellow]Research already exists for this event. Displaying cached results...[/yellow]\n")
+        _display_group_research_result(group, result, trading_config)
+        
         # Prompt for trades if recommendations exist
         if result.recommendations:
             _prompt_for_group_trades(
@@ -456,52 +559,30 @@ def _handle_group_research(
     # Run new group research
     console.print("[cyan]Starting deep multi-outcome research...[/cyan]\n")
     
-    progress_messages = []
-    
-    def progress_callback(progress: ResearchProgress) -> None:
-        """Callback for research progress updates."""
-        progress_messages.append(progress.message)
+    view = _ProgressView(
+        title="Group Research Progress",
+        initial="Initializing group research...",
+        done_message="Group research complete!",
+        styles=_GROUP_PROGRESS_STYLES,
+    )
     
     # Run research with live progress display
-    with Live(Panel("Initializing group research...", title="Research Progress"), refresh_per_second=4) as live:
-        def update_callback(progress: ResearchProgress) -> None:
-            progress_callback(progress)
-            
-            # Show last 15 messages
-            recent = progress_messages[-15:]
-            formatted_messages = []
-            for msg in recent:
-                if msg.startswith("Round"):
-                    formatted_messages.append(f"[cyan]{msg}[/cyan]")
-                elif "🔍" in msg:
-                    formatted_messages.append(f"[green]{msg}[/green]")
-                else:
-                    formatted_messages.append(f"[dim]{msg}[/dim]")
-            
-            content = "\n".join(formatted_messages)
-            content += f"\n\n[bold]Round {progress.round_number}/{progress.total_rounds}[/bold]"
-            
-            if progress.completed:
-                content += "\n\n[green]✓ Group research complete![/green]"
-            
-            live.update(Panel(content, title="Group Research Progress", border_style="cyan"))
-        
+    # Redirected output: no refresh thread, Live renders the final state once on exit
+    with Live(get_renderable=view.render, refresh_per_second=LIVE_REFRESH_PER_SECOND, auto_refresh=console.is_terminal):
         try:
-            result = asyncio.run(research_service.research_market_group(
+            result = run_coro(research_service.research_market_group(
                 group=group,
-                callback=update_callback,
+                callback=view.update,
                 rounds=optimal_rounds,
             ))
             console.print("[dim]Research method returned successfully[/dim]")
         except Exception as e:
             console.print(f"\n[red]Research failed: {e}[/red]")
-            import traceback
             console.print(f"[dim]{traceback.format_exc()}[/dim]")
             return
     
-    # Force output to appear after Live context closes
-    import time
-    time.sleep(0.2)  # Longer pause to ensure Live is fully closed
+    # Leaving the Live block stops its refresh thread and draws the final
+    # frame synchronously, so later output is already ordered after it
     console.print("\n")  # Extra newline for separation
     
     console.print("[green]✓ Group research completed![/green]\n")
@@ -515,15 +596,14 @@ def _handle_group_research(
         console.print(f"  Cost: ${result.estimated_cost_usd:.4f}")
     console.print()
     
-    try:
-        # Store research results
-        research_repo.upsert_result(
-            result=result,
-            eval_edge=0.0,  # Group edge calculated differently
-            eval_recommendation="review",  # User reviews recommendations
-        )
-    except Exception as e:
-        console.print(f"[yellow]Warning: Could not store results: {e}[/yellow]\n")
+    # Store research results in the background while they're displayed
+    stored = _io_pool.submit(
+        research_repo.upsert_result,
+        result=result,
+        eval_edge=0.0,  # Group edge calculated differently
+        eval_recommendation="review",  # User reviews recommendations
+        market_end_date=group.end_date,
+    )
     
     # Display results (with explicit error handling)
     console.print("[dim]Preparing to display results...[/dim]\n")
@@ -533,9 +613,13 @@ def _handle_group_research(
         console.print("[dim]Results displayed successfully[/dim]\n")
     except Exception as e:
         console.print(f"[red]Error displaying results: {e}[/red]")
-        import traceback
         console.print(f"[dim]{traceback.format_exc()}[/dim]")
         return
+    finally:
+        try:
+            stored.result()
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not store results: {e}[/yellow]\n")
     
     try:
         # Validate research quality
@@ -564,6 +648,21 @@ def _handle_group_research(
             pass
 
 
+@lru_cache(maxsize=256)
+def _candidate_name(question: str, group_title: str) -> str:
+    """Extract the candidate/party name from a grouped-event market question.
+    
+    Cached: the display and trade-prompt passes both resolve the same
+    recommendations.
+    """
+    if "Will " in question and " win" in question:
+        return question.split("Will ")[-1].split(" win")[0].strip()
+    if " - " in question:
+        return question.split(" - ")[0].strip()
+    # Try to find the unique part of the question
+    return question.replace(group_title, "").strip().split(":")[0][:40]
+
+
 def _display_group_research_result(
     group: MarketGroup,
     result: ResearchResult,
@@ -571,68 +670,56 @@ def _display_group_research_result(
 ) -> None:
     """Display research results for a grouped event."""
     
-    content = f"[bold]Event:[/bold] {group.title}\n"
-    content += f"[bold]Total Markets:[/bold] {len(group.markets)}\n\n"
+    parts = [
+        f"[bold]Event:[/bold] {group.title}\n",
+        f"[bold]Total Markets:[/bold] {len(group.markets)}\n\n",
+    ]
     
     if result.recommendations:
         total_suggested_stake = sum(r.suggested_stake for r in result.recommendations if r.entry_suggested)
-        content += f"[bold green]RECOMMENDATIONS ({len(result.recommendations)} positions):[/bold green]\n"
+        parts.append(f"[bold green]RECOMMENDATIONS ({len(result.recommendations)} positions):[/bold green]\n")
         if total_suggested_stake > 0:
-            content += f"[dim]Total portfolio allocation: ${total_suggested_stake:.0f}[/dim]\n\n"
+            parts.append(f"[dim]Total portfolio allocation: ${total_suggested_stake:.0f}[/dim]\n\n")
         
         for i, rec in enumerate(result.recommendations, 1):
-            # Extract candidate/party name from question
-            question = rec.market_question
-            if "Will " in question and " win" in question:
-                candidate = question.split("Will ")[-1].split(" win")[0].strip()
-            elif " - " in question:
-                candidate = question.split(" - ")[0].strip()
-            else:
-                # Try to find the unique part of the question
-                candidate = question.replace(group.title, "").strip().split(":")[0][:40]
+            candidate = _candidate_name(rec.market_question, group.title)
             
-            # Find market to get current odds - try multiple matching strategies
-            market = next((m for m in group.markets if m.id == rec.market_id), None)
-            
-            # If not found by ID, try matching by question similarity
-            if not market and candidate:
-                market = next((m for m in group.markets if candidate.lower() in m.question.lower()), None)
+            # Find market to get current odds - by ID, then by question similarity
+            market = group.find_market(rec.market_id, candidate)
             
             current_odds = 0.0
             if market:
-                current_odds = next((o.price for o in market.outcomes if o.outcome.lower() in ('yes', 'y')), 0.0)
+                current_odds = market.yes_price
             
-            content += f"{i}. [bold]{candidate}[/bold] - {rec.prediction}\n"
-            content += f"   Win Probability: {rec.probability:.1%} | Current Odds: {current_odds:.1%} | Confidence: {int(rec.confidence)}%\n"
+            parts.append(f"{i}. [bold]{candidate}[/bold] - {rec.prediction}\n")
+            parts.append(f"   Win Probability: {rec.probability:.1%} | Current Odds: {current_odds:.1%} | Confidence: {int(rec.confidence)}%\n")
             
             if rec.entry_suggested:
                 pct_of_portfolio = (rec.suggested_stake / total_suggested_stake * 100) if total_suggested_stake > 0 else 0
-                content += f"   [green]✓ ENTER: ${rec.suggested_stake:.0f} ({pct_of_portfolio:.0f}% of portfolio)[/green]\n"
+                parts.append(f"   [green]✓ ENTER: ${rec.suggested_stake:.0f} ({pct_of_portfolio:.0f}% of portfolio)[/green]\n")
                 
                 # Calculate expected value
                 if current_odds > 0:
                     shares = rec.suggested_stake / current_odds
                     ev = (rec.probability * shares) - ((1 - rec.probability) * rec.suggested_stake)
-                    content += f"   Expected Value: [cyan]${ev:+.2f}[/cyan]\n"
+                    parts.append(f"   Expected Value: [cyan]${ev:+.2f}[/cyan]\n")
             else:
-                content += f"   [yellow]○ Analyze only (no entry suggested)[/yellow]\n"
+                parts.append(_ANALYZE_ONLY_LINE)
             
-            content += f"   {rec.rationale[:120]}...\n\n"
+            parts.append(f"   {rec.rationale[:120]}...\n\n")
     else:
-        content += "[yellow]No specific recommendations generated yet.[/yellow]\n"
-        content += f"[dim]This feature is under development.[/dim]\n"
+        parts.append(_NO_RECOMMENDATIONS_TEXT)
     
-    content += f"\n[bold]Overall Analysis:[/bold]\n{result.rationale[:200]}...\n\n"
+    parts.append(f"\n[bold]Overall Analysis:[/bold]\n{result.rationale[:200]}...\n\n")
     
     if result.key_findings:
-        content += f"[bold]Key Findings:[/bold]\n"
-        for finding in result.key_findings[:3]:
-            content += f"  • {finding}\n"
+        parts.append("[bold]Key Findings:[/bold]\n")
+        parts.extend(f"  • {finding}\n" for finding in result.key_findings[:3])
     
     if result.estimated_cost_usd:
-        content += f"\n[dim]Research cost: ${result.estimated_cost_usd:.4f} | Duration: {result.duration_minutes} min[/dim]"
+        parts.append(f"\n[dim]Research cost: ${result.estimated_cost_usd:.4f} | Duration: {result.duration_minutes} min[/dim]")
     
-    console.print(Panel(content, title="Group Research Results", border_style="green"))
+    console.print(Panel("".join(parts), title="Group Research Results", border_style="green"))
 
 
 def _prompt_for_group_trades(
@@ -644,37 +731,35 @@ def _prompt_for_group_trades(
 ) -> None:
     """Prompt user to enter multiple positions from group research."""
     
-    # Filter to only entry-suggested recommendations
-    suggested = [r for r in result.recommendations if r.entry_suggested]
+    # Filter to only entry-suggested recommendations, totalling stakes as we go
+    # (percentages below need the total before anything is printed)
+    suggested = []
+    total_stake = 0.0
+    for rec in result.recommendations:
+        if rec.entry_suggested:
+            suggested.append(rec)
+            total_stake += rec.suggested_stake
     
     if not suggested:
         console.print("\n[yellow]No positions recommended for entry.[/yellow]")
         research_repo.set_decision(group.id, "pass")
         return
     
-    console.print(f"\n[bold]Research suggests {len(suggested)} position(s):[/bold]")
-    console.print("[dim]Portfolio-optimized strategy with varying position sizes:[/dim]\n")
-    
-    total_stake = sum(rec.suggested_stake for rec in suggested)
+    # Lines are collected and printed at once rather than three prints per position
+    lines = [
+        f"\n[bold]Research suggests {len(suggested)} position(s):[/bold]",
+        "[dim]Portfolio-optimized strategy with varying position sizes:[/dim]\n",
+    ]
     total_ev = 0.0
     
     for i, rec in enumerate(suggested, 1):
-        # Extract candidate/party name
-        question = rec.market_question
-        if "Will " in question and " win" in question:
-            candidate = question.split("Will ")[-1].split(" win")[0].strip()
-        elif " - " in question:
-            candidate = question.split(" - ")[0].strip()
-        else:
-            candidate = question.replace(group.title, "").strip().split(":")[0][:40]
+        candidate = _candidate_name(rec.market_question, group.title)
         
-        # Find market to get current odds - try multiple matching strategies
-        market = next((m for m in group.markets if m.id == rec.market_id), None)
-        if not market and candidate:
-            market = next((m for m in group.markets if candidate.lower() in m.question.lower()), None)
+        # Find market to get current odds - by ID, then by question similarity
+        market = group.find_market(rec.market_id, candidate)
         if market:
             # Get Yes probability (winning odds)
-            odds = next((o.price for o in market.outcomes if o.outcome.lower() in ('yes', 'y')), 0.5)
+            odds = market.yes_price if market.yes_outcome else 0.5
             
             # Calculate EV and potential payout
             shares = rec.suggested_stake / odds if odds > 0 else 0
@@ -684,18 +769,20 @@ def _prompt_for_group_trades(
             
             pct_of_portfolio = (rec.suggested_stake / total_stake * 100) if total_stake > 0 else 0
             
-            console.print(f"  {i}. [cyan]{candidate}[/cyan] {rec.prediction} @ {odds:.1%}")
-            console.print(f"     Stake: [bold]${rec.suggested_stake:.0f}[/bold] ({pct_of_portfolio:.0f}% of portfolio)")
-            console.print(f"     Potential: ${payout:.0f} | EV: ${ev:+.2f}")
-    
-    console.print(f"\n[bold]Portfolio Summary:[/bold]")
-    console.print(f"  Total Stake: ${total_stake:.0f}")
-    console.print(f"  Combined EV: [cyan]${total_ev:+.2f}[/cyan]")
+            lines.append(f"  {i}. [cyan]{candidate}[/cyan] {rec.prediction} @ {odds:.1%}")
+            lines.append(f"     Stake: [bold]${rec.suggested_stake:.0f}[/bold] ({pct_of_portfolio:.0f}% of portfolio)")
+            lines.append(f"     Potential: ${payout:.0f} | EV: ${ev:+.2f}")
     
     # Calculate ROI
     roi = (total_ev / total_stake * 100) if total_stake > 0 else 0
-    console.print(f"  Portfolio ROI: [cyan]{roi:+.1f}%[/cyan]")
-    console.print(f"  Strategy: Diversified hedge across {len(suggested)} positions")
+    lines += [
+        "\n[bold]Portfolio Summary:[/bold]",
+        f"  Total Stake: ${total_stake:.0f}",
+        f"  Combined EV: [cyan]${total_ev:+.2f}[/cyan]",
+        f"  Portfolio ROI: [cyan]{roi:+.1f}%[/cyan]",
+        f"  Strategy: Diversified hedge across {len(suggested)} positions",
+    ]
+    console.print("\n".join(lines))
     
     # For now, just record decision
     console.print("\n[yellow]⚠️  Multi-position entry not yet implemented.[/yellow]")
@@ -719,16 +806,12 @@ def _validate_research_quality(group: MarketGroup, result: ResearchResult) -> No
     
     # Check if found edge
     if result.recommendations:
-        edges = []
-        for rec in result.recommendations:
-            # Find market
-            market = next((m for m in group.markets if m.id == rec.market_id), None)
-            if market:
-                current = next((o.price for o in market.outcomes if o.outcome.lower() in ('yes', 'y')), 0.0)
-                edge = abs(rec.probability - current)
-                edges.append(edge)
-        
-        max_edge = max(edges) if edges else 0.0
+        # One pass over recommendations; id lookup and Yes price are precomputed
+        markets = ((rec, group.find_market(rec.market_id)) for rec in result.recommendations)
+        max_edge = max(
+            (abs(rec.probability - market.yes_price) for rec, market in markets if market),
+            default=0.0,
+        )
         if max_edge > 0.15:
             successes.append(f"✓ Found strong edge ({max_edge:.1%})")
         elif max_edge > 0.10:
@@ -1,25 +1,40 @@
 """Trade execution command handlers for Polly CLI."""
 
+import time
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
+from rich.text import Text
 
 from polly.config import TradingConfig
 from polly.models import Market, MarketGroup, Trade
 from polly.services.trading import TradingService
-from polly.services.validators import (
-    check_usdc_balance,
-    validate_market_active,
-    validate_token_id,
-    validate_trade_size,
-)
+from polly.services.validators import validate_market_active, validate_token_id
 from polly.storage.trades import TradeRepository
+from polly.ui.console import console
 from polly.ui.formatters import format_profit
 
-console = Console()
+# Fixed trade prompt renderables, built (and their markup parsed) once at import
+REAL_TRADE_PANEL = Panel(Text.from_markup("[bold red]⚠️  REAL MONEY TRADE[/bold red]"), style="red")
+_ENTRY_PANELS = {
+    True: Panel(Text.from_markup("[bold][red]REAL[/red] Position Entry[/bold]"), border_style="cyan"),
+    False: Panel(Text.from_markup("[bold][green]PAPER[/green] Position Entry[/bold]"), border_style="cyan"),
+}
+_TRADE_CANCELLED = Text("Trade cancelled", style="yellow")
+
+# Available balance is reused this long, so the prompt and confirmation of one
+# trade command don't each hit the wallet RPC / metrics query
+BALANCE_TTL_SECONDS = 5.0
+
+# Trading mode -> (available balance, fetched at)
+_balance_cache: dict[str, tuple[float, float]] = {}
+
+
+def invalidate_balance_cache() -> None:
+    """Drop cached balances so the next read is fresh (call after trading)."""
+    _balance_cache.clear()
 
 
 def get_available_balance(
@@ -37,14 +52,25 @@ def get_available_balance(
     Returns:
         Available balance in USDC
     """
-    if trading_config.mode == "real" and trading_service:
+    mode = "real" if trading_config.mode == "real" and trading_service else "paper"
+    cached = _balance_cache.get(mode)
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < BALANCE_TTL_SECONDS:
+        return cached[0]
+    
+    if mode == "real":
         # Real mode: get actual wallet balance
         balances = trading_service.get_balances()
-        return balances.get("usdc", 0.0)
+        balance = balances.get("usdc", 0.0)
+        if "error" in balances:
+            return balance  # Don't hold on to a failed fetch
     else:
         # Paper mode: calculate from starting cash + realized - active
         metrics = trade_repo.metrics(starting_cash=trading_config.starting_cash, filter_mode="paper")
-        return metrics.cash_available
+        balance = metrics.cash_available
+    
+    _balance_cache[mode] = (balance, now)
+    return balance
 
 
 def prompt_for_amount(
@@ -68,22 +94,21 @@ def prompt_for_amount(
     Returns:
         Stake amount or None if cancelled
     """
-    mode_label = "[red]REAL[/red]" if is_real_mode else "[green]PAPER[/green]"
-    
-    console.print()
-    console.print(Panel(f"[bold]{mode_label} Position Entry[/bold]", border_style="cyan"))
-    console.print()
-    console.print(f"[bold]Market:[/bold] {market_question}")
-    console.print(f"[bold]Outcome:[/bold] {outcome_name}")
-    console.print(f"[bold]Current Price:[/bold] ${outcome_price:.3f}")
-    console.print(f"[bold]Available Balance:[/bold] ${available_balance:.2f}")
     console.print()
+    console.print(_ENTRY_PANELS[is_real_mode])
+    console.print(
+        f"\n[bold]Market:[/bold] {market_question}\n"
+        f"[bold]Outcome:[/bold] {outcome_name}\n"
+        f"[bold]Current Price:[/bold] ${outcome_price:.3f}\n"
+        f"[bold]Available Balance:[/bold] ${available_balance:.2f}\n"
+    )
+    
+    # Same prompt on every retry; an invalid entry only prints its error line
+    prompt_text = f"Enter stake amount (default: ${default_stake:.0f}, max: ${available_balance:.2f})"
+    default_text = str(default_stake)
     
     while True:
-        amount_str = Prompt.ask(
-            f"Enter stake amount (default: ${default_stake:.0f}, max: ${available_balance:.2f})",
-            default=str(default_stake),
-        )
+        amount_str = Prompt.ask(prompt_text, default=default_text)
         
         try:
             amount = float(amount_str)
@@ -99,12 +124,12 @@ def prompt_for_amount(
             max_payout = estimated_shares * 1.0  # Max payout is shares * $1
             profit = max_payout - amount
             
-            console.print()
-            console.print(f"[bold]Stake Amount:[/bold] ${amount:.2f}")
-            console.print(f"[bold]Est. Shares:[/bold] {estimated_shares:.2f}")
-            console.print(f"[bold]Max Payout:[/bold] ${max_payout:.2f}")
-            console.print(f"[bold]Potential Profit:[/bold] ${profit:.2f} ({(profit/amount)*100:.1f}%)")
-            console.print()
+            console.print(
+                f"\n[bold]Stake Amount:[/bold] ${amount:.2f}\n"
+                f"[bold]Est. Shares:[/bold] {estimated_shares:.2f}\n"
+                f"[bold]Max Payout:[/bold] ${max_payout:.2f}\n"
+                f"[bold]Potential Profit:[/bold] ${profit:.2f} ({(profit/amount)*100:.1f}%)\n"
+            )
             
             return amount
             
@@ -179,16 +204,12 @@ def handle_trade(
         console.print(f"[red]{error_msg}[/red]")
         return
 
-    # Find matching outcome
-    matching_outcome = None
-    for outcome in market.outcomes:
-        if outcome.outcome.lower() == outcome_name.lower():
-            matching_outcome = outcome
-            break
+    # Find matching outcome (case-insensitive)
+    matching_outcome = market.outcome_by_name.get(outcome_name.lower())
 
     if not matching_outcome:
         console.print(f"[red]Outcome '{outcome_name}' not found in market[/red]")
-        valid_outcomes = ", ".join([f"{o.outcome} (${o.price:.3f})" for o in market.outcomes])
+        valid_outcomes = ", ".join(f"{o.outcome} (${o.price:.3f})" for o in market.outcomes)
         console.print(f"[dim]Valid outcomes: {valid_outcomes}[/dim]")
         return
     
@@ -214,13 +235,13 @@ def handle_trade(
     )
     
     if amount is None:
-        console.print("[yellow]Trade cancelled[/yellow]")
+        console.print(_TRADE_CANCELLED)
         return
 
     # Final confirmation for real money
-    console.print(Panel(f"[bold red]⚠️  REAL MONEY TRADE[/bold red]", style="red"))
+    console.print(REAL_TRADE_PANEL)
     if not Confirm.ask("Execute real trade?", default=False):
-        console.print("[yellow]Trade cancelled[/yellow]")
+        console.print(_TRADE_CANCELLED)
         return
 
     # Execute trade - pass the stake amount, let trading service calculate shares from orderbook
@@ -269,6 +290,7 @@ def handle_trade(
             order_id=result.order_id,
         )
         trade_repo.record_trade(trade)
+        invalidate_balance_cache()
 
         console.print("[green]✓ Trade executed successfully[/green]")
         console.print(f"[dim]Order ID: {result.order_id}[/dim]")
@@ -390,6 +412,7 @@ def handle_close(
             actual_outcome=trade_to_close.selected_option,  # Manually closed
             profit_loss=final_pnl
         )
+        invalidate_balance_cache()
 
         console.print("[green]✓ Position closed successfully[/green]")
         console.print(f"[dim]Order ID: {result.order_id}[/dim]")
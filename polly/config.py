@@ -11,6 +11,7 @@ import yaml
 
 DEFAULT_CONFIG_PATH = Path.home() / ".polly" / "config.yml"
 DEFAULT_DB_PATH = Path.home() / ".polly" / "trades.db"
+AUTOPILOT_STATE_PATH = Path.home() / ".polly" / "autopilot_state.json"
 
 
 @dataclass(slots=True)
@@ -53,6 +54,7 @@ class PollConfig:
     exclude_categories: tuple[str, ...] = ("sports", "esports")
     liquidity_weight_open_interest: float = 0.7
     liquidity_weight_volume_24h: float = 0.3
+    cache_ttl_seconds: int = 45  # How long a fetched market list is reused
 
 
 @dataclass(slots=True)
@@ -116,6 +118,7 @@ def load_config(path: Path | None = None) -> AppConfig:
             liquidity_weight_volume_24h=float(
                 polls.get("liquidity_weight", {}).get("volume_24h", 0.3)
             ),
+            cache_ttl_seconds=int(polls.get("cache_ttl_seconds", 45)),
         ),
         database_path=Path(database.get("path", DEFAULT_DB_PATH)),
     )
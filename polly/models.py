@@ -4,8 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Dict, List, Optional
 
+# Outcome labels treated as the "Yes" side of a binary market
+_YES_LABELS = frozenset(("yes", "y"))
+
 
 @dataclass(slots=True)
 class MarketOutcome:
@@ -35,6 +39,50 @@ class Market:
     event_id: str | None = None
     event_title: str | None = None
     is_grouped: bool = False
+    # Lazily built outcome -> price index (slots rule out cached_property)
+    _price_index: Dict[str, float] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Lazily built lowercased outcome label -> outcome index
+    _outcome_index: Dict[str, MarketOutcome] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Casefolded question/description/category/tags, NUL-separated, for search
+    search_blob_lc: str = field(default="", init=False, repr=False, compare=False)
+    # Highest outcome price (0.0 when there are no outcomes)
+    max_outcome_price: float = field(default=0.0, init=False, repr=False, compare=False)
+    # The "Yes" outcome (None when the market has none) and its price (0.0 then)
+    yes_outcome: MarketOutcome | None = field(default=None, init=False, repr=False, compare=False)
+    yes_price: float = field(default=0.0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.search_blob_lc = "\0".join(
+            (self.question, self.description or "", self.category or "", *self.tags)
+        ).casefold()
+        self.max_outcome_price = max((o.price for o in self.outcomes), default=0.0)
+        self.yes_outcome = next(
+            (o for o in self.outcomes if o.outcome.casefold() in _YES_LABELS), None
+        )
+        self.yes_price = self.yes_outcome.price if self.yes_outcome else 0.0
+
+    @property
+    def price_by_outcome(self) -> Dict[str, float]:
+        """Return a cached mapping of outcome label to price for O(1) lookups."""
+
+        if self._price_index is None:
+            self._price_index = self.formatted_odds()
+        return self._price_index
+
+    @property
+    def outcome_by_name(self) -> Dict[str, MarketOutcome]:
+        """Return a cached mapping of lowercased outcome label to outcome.
+
+        The first outcome wins if two labels differ only by case.
+        """
+
+        if self._outcome_index is None:
+            self._outcome_index = {o.outcome.lower(): o for o in reversed(self.outcomes)}
+        return self._outcome_index
 
     @property
     def time_remaining(self) -> timedelta:
@@ -64,23 +112,87 @@ class MarketGroup:
     show_all_outcomes: bool
     markets: List[Market]            # All binary markets in group
     resolution_source: str = ""
+    # Casefolded title/description/category/tags, NUL-separated, for search
+    search_blob_lc: str = field(default="", init=False, repr=False, compare=False)
+    # Highest outcome price across all markets in the group (0.0 when empty)
+    max_outcome_price: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Memoized markets sorted by highest outcome price (slots rule out cached_property)
+    _markets_by_odds: List[Market] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Memoized market id -> market and (lowercased question, market) lookups
+    _markets_by_id: Dict[str, Market] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _questions_lower: List[tuple[str, Market]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Memoized markets sorted by Yes price, descending (see get_top_markets)
+    _markets_by_yes: List[Market] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        self.search_blob_lc = "\0".join(
+            (self.title, self.description or "", self.category or "", *self.tags)
+        ).casefold()
+        self.max_outcome_price = max(
+            (m.max_outcome_price for m in self.markets), default=0.0
+        )
     
     @property
     def time_remaining(self) -> timedelta:
         """Return the remaining time until resolution."""
         return max(self.end_date - datetime.now(tz=self.end_date.tzinfo), timedelta())
     
+    @property
+    def markets_by_odds(self) -> List[Market]:
+        """Markets sorted by highest outcome price, descending (computed once)."""
+        if self._markets_by_odds is None:
+            self._markets_by_odds = sorted(
+                self.markets, key=attrgetter("max_outcome_price"), reverse=True
+            )
+        return self._markets_by_odds
+    
+    def find_market(self, market_id: str, candidate: str = "") -> Market | None:
+        """Find a market by id, falling back to a candidate name in its question.
+        
+        Both lookups are indexed on first use, so resolving many
+        recommendations against a large group stays linear.
+        
+        Args:
+            market_id: Condition id reported by research
+            candidate: Name to search for (case-insensitive) if the id is unknown
+            
+        Returns:
+            The matching market, or None
+        """
+        if self._markets_by_id is None:
+            self._markets_by_id = {m.id: m for m in self.markets}
+        market = self._markets_by_id.get(market_id)
+        if market is not None or not candidate:
+            return market
+        
+        if self._questions_lower is None:
+            self._questions_lower = [(m.question.lower(), m) for m in self.markets]
+        candidate_lower = candidate.lower()
+        return next((m for question, m in self._questions_lower if candidate_lower in question), None)
+    
     def get_top_markets(self, n: int = 5) -> List[Market]:
-        """Get top N markets by highest Yes probability (winning odds)."""
+        """Get top N markets by highest Yes probability (winning odds).
+        
+        The ranking is computed once per group; later calls just slice it.
+        """
         def get_yes_price(market: Market) -> float:
             """Get the 'Yes' price for a market, representing win probability."""
-            for outcome in market.outcomes:
-                if outcome.outcome.lower() in ('yes', 'y'):
-                    return outcome.price
+            if market.yes_outcome is not None:
+                return market.yes_price
             # If no Yes found, return the minimum price (likely the winning outcome)
             return min(o.price for o in market.outcomes) if market.outcomes else 0
         
-        return sorted(self.markets, key=get_yes_price, reverse=True)[:n]
+        if self._markets_by_yes is None:
+            self._markets_by_yes = sorted(self.markets, key=get_yes_price, reverse=True)
+        return self._markets_by_yes[:n]
 
 
 @dataclass(slots=True)
@@ -181,3 +293,10 @@ class PortfolioMetrics:
     cash_available: float = 0.0
     cash_in_play: float = 0.0
 
+
+@dataclass(slots=True)
+class PortfolioSnapshot:
+    """Portfolio metrics and active trades read over one DB connection."""
+
+    metrics: PortfolioMetrics
+    active_trades: List[Trade]
@@ -29,7 +29,7 @@ class PositionEvaluator:
     def evaluate(self, market: Market, research: ResearchResult) -> Evaluation:
         """Return an evaluation for the researched market."""
 
-        market_odds = market.formatted_odds()
+        market_odds = market.price_by_outcome
         predicted_price = research.probability
 
         reference_price = market_odds.get(research.prediction)
@@ -121,19 +121,12 @@ class PositionEvaluator:
         
         for rec in recommendations:
             # Find the corresponding market in the group
-            market = next((m for m in group.markets if m.id == rec.market_id), None)
+            market = group.find_market(rec.market_id)
             if not market:
                 continue
             
             # Get current market odds (Yes probability for winning)
-            current_price = 0.0
-            for outcome in market.outcomes:
-                if outcome.outcome.lower() in ('yes', 'y'):
-                    current_price = outcome.price
-                    break
-            
-            if current_price == 0.0:
-                current_price = 0.5  # Fallback
+            current_price = market.yes_price or 0.5  # Fallback when missing/zero
             
             # Calculate edge
             edge = rec.probability - current_price
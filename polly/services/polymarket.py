@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import json
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from importlib import import_module, util
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from polly.config import PollConfig
 from polly.models import Market, MarketGroup, MarketOutcome
 
+try:
+    import orjson  # Optional: much faster parsing of large Gamma payloads
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 HOST = "https://clob.polymarket.com"
 GAMMA_API = "https://gamma-api.polymarket.com"
@@ -22,9 +32,26 @@ class PolymarketService:
     """Service responsible for fetching and formatting markets."""
 
     poll_config: PollConfig
+    http: Optional[requests.Session] = None
 
     def __post_init__(self) -> None:
         self._client = self._create_client()
+        if self.http is None:
+            self.http = create_http_session()
+        # TTL cache of the full filtered/sorted market list (shared across commands)
+        self._items_cache: List[Market | MarketGroup] | None = None
+        self._items_cached_at = 0.0
+        self._items_lock = threading.Lock()
+        self._index: MarketIndex | None = None
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached market list so the next fetch hits the API."""
+        self._items_cache = None
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        if self.http is not None:
+            self.http.close()
 
     async def fetch_top_markets(self) -> List[Market | MarketGroup]:
         """Fetch the top configured markets (first page)."""
@@ -38,13 +65,17 @@ class PolymarketService:
         """Fetch all active filtered markets and market groups (no slicing)."""
         return await asyncio.to_thread(self._fetch_markets_sync, None)
 
+    async def fetch_market_index(self) -> MarketIndex:
+        """Fetch all markets along with precomputed filter/sort columns."""
+        return await asyncio.to_thread(self._get_index)
+
     async def fetch_market_by_id(self, condition_id: str) -> Market | None:
         """Fetch a single market by condition_id.
         
         Searches both individual markets and markets within groups.
         """
         def _inner() -> Market | None:
-            all_items = self._fetch_markets_sync(None)
+            all_items = self._get_all_items()
             
             for item in all_items:
                 # Check if it's a direct market match
@@ -61,11 +92,26 @@ class PolymarketService:
         return await asyncio.to_thread(_inner)
 
     async def fetch_markets_by_ids(self, condition_ids: list[str]) -> List[Market]:
-        """Fetch multiple markets by condition_ids."""
-        ids_set = set(condition_ids)
+        """Fetch multiple markets by condition_ids in a single request.
+        
+        Like fetch_market_by_id, searches both individual markets and
+        markets within groups.
+        """
         def _inner() -> List[Market]:
-            all_markets = self._fetch_markets_sync(None)
-            return [m for m in all_markets if m.id in ids_set]
+            remaining = set(condition_ids)
+            found = []
+            for item in self._get_all_items():
+                if not remaining:
+                    break  # Every requested id located; skip the rest of the list
+                if isinstance(item, MarketGroup):
+                    for m in item.markets:
+                        if m.id in remaining:
+                            found.append(m)
+                            remaining.discard(m.id)
+                elif item.id in remaining:
+                    found.append(item)
+                    remaining.discard(item.id)
+            return found
         return await asyncio.to_thread(_inner)
 
     def _create_client(self):
@@ -158,15 +204,51 @@ class PolymarketService:
     def _fetch_markets_sync(self, page: int | None = 1, page_size: int = 20) -> List[Market | MarketGroup]:
         """Fetch and return both individual markets and grouped events."""
         
+        items_sorted = self._get_all_items()
+        
+        # Simple pagination via slicing
+        if page is None:
+            return list(items_sorted)
+        start = max((int(page) - 1) * page_size, 0)
+        end = max(start + page_size, 0)
+        return items_sorted[start:end]
+    
+    def _get_all_items(self) -> List[Market | MarketGroup]:
+        """Return the sorted market list, refetching once the TTL has expired.
+        
+        The lock makes concurrent callers (e.g. autopilot monitor + scan)
+        share a single download instead of racing to fetch it twice.
+        """
+        with self._items_lock:
+            ttl = self.poll_config.cache_ttl_seconds
+            if (
+                self._items_cache is None
+                or time.monotonic() - self._items_cached_at > ttl
+            ):
+                self._items_cache = self._fetch_all_items_sync()
+                self._items_cached_at = time.monotonic()
+            return self._items_cache
+    
+    def _get_index(self) -> MarketIndex:
+        """Return the index for the current cached list, rebuilding it on refetch."""
+        items = self._get_all_items()
+        index = self._index
+        if index is None or index.items is not items:
+            index = self._index = MarketIndex.build(items)
+        return index
+    
+    def _fetch_all_items_sync(self) -> List[Market | MarketGroup]:
+        """Download and parse every active event from the Gamma API."""
+        
         # Fetch from Gamma API /events endpoint
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{GAMMA_API}/events",
                 params={"closed": "false", "limit": 1000, "archived": "false"},
                 timeout=30
             )
             response.raise_for_status()
-            raw_events = response.json()
+            raw_events = _json_loads(response.content)
         except Exception as e:
             raise RuntimeError(f"Failed to fetch events from Gamma API: {e}")
         
@@ -224,14 +306,7 @@ class PolymarketService:
                                 items.append(market)
         
         # Sort by liquidity score
-        items_sorted = self._sort_items(items)
-        
-        # Simple pagination via slicing
-        if page is None:
-            return items_sorted
-        start = max((int(page) - 1) * page_size, 0)
-        end = max(start + page_size, 0)
-        return items_sorted[start:end]
+        return self._sort_items(items)
     
     def _should_include_group(self, group: MarketGroup) -> bool:
         """Check if a market group should be included based on filters."""
@@ -435,10 +510,9 @@ class PolymarketService:
             ]
         elif market.get("outcomePrices") and market.get("outcomes"):
             # Gamma API format
-            import json
-            outcome_names = json.loads(market["outcomes"]) if isinstance(market["outcomes"], str) else market["outcomes"]
-            outcome_prices = json.loads(market["outcomePrices"]) if isinstance(market["outcomePrices"], str) else market["outcomePrices"]
-            token_ids = json.loads(market.get("clobTokenIds", "[]")) if isinstance(market.get("clobTokenIds"), str) else market.get("clobTokenIds", [])
+            outcome_names = _json_loads(market["outcomes"]) if isinstance(market["outcomes"], str) else market["outcomes"]
+            outcome_prices = _json_loads(market["outcomePrices"]) if isinstance(market["outcomePrices"], str) else market["outcomePrices"]
+            token_ids = _json_loads(market.get("clobTokenIds", "[]")) if isinstance(market.get("clobTokenIds"), str) else market.get("clobTokenIds", [])
             
             for i, (name, price) in enumerate(zip(outcome_names, outcome_prices)):
                 token_id = token_ids[i] if i < len(token_ids) else ""
@@ -480,11 +554,9 @@ class PolymarketService:
         tags = market.get("tags", [])
         event_tags = market.get("event_tags", [])
         if isinstance(tags, str):
-            import json
-            tags = json.loads(tags) if tags else []
+            tags = _json_loads(tags) if tags else []
         if isinstance(event_tags, str):
-            import json
-            event_tags = json.loads(event_tags) if event_tags else []
+            event_tags = _json_loads(event_tags) if event_tags else []
         
         # Extract tag labels from tag objects
         tag_labels = []
@@ -543,10 +615,67 @@ class PolymarketService:
         )
 
 
-def filter_by_expiry_days(items: List[Market | MarketGroup], days: int) -> List[Market | MarketGroup]:
-    """Filter markets/groups expiring within N days."""
-    cutoff = datetime.now(tz=timezone.utc) + timedelta(days=days)
-    return [item for item in items if item.end_date <= cutoff]
+@dataclass(slots=True)
+class MarketIndex:
+    """Column-oriented view of a market list for /polls filtering.
+    
+    Each column is computed once per fetch so repeated queries only walk
+    flat lists instead of re-lowering strings and re-scanning outcomes.
+    Filters take and return positions into ``items``.
+    """
+    
+    items: List[Market | MarketGroup]
+    search_blobs: List[str] = field(default_factory=list)   # item.search_blob_lc
+    max_prices: List[float] = field(default_factory=list)   # highest outcome price (odds sort key)
+    filter_prices: List[float] = field(default_factory=list)  # lowest price that must pass -odds
+    end_ts: List[float] = field(default_factory=list)       # end_date as POSIX timestamp
+    
+    @classmethod
+    def build(cls, items: List[Market | MarketGroup]) -> MarketIndex:
+        """Precompute the filter/sort columns for ``items``."""
+        index = cls(items=items)
+        for item in items:
+            index.max_prices.append(item.max_outcome_price)
+            if isinstance(item, MarketGroup):
+                # A group passes -odds if any of its markets does
+                index.filter_prices.append(min(
+                    (m.max_outcome_price for m in item.markets if m.outcomes),
+                    default=float("inf"),
+                ))
+            else:
+                index.filter_prices.append(item.max_outcome_price if item.outcomes else float("inf"))
+            index.search_blobs.append(item.search_blob_lc)
+            index.end_ts.append(item.end_date.timestamp())
+        return index
+    
+    def expiring_within(self, positions: Iterable[int], days: int) -> List[int]:
+        """Keep positions whose item resolves within ``days`` days."""
+        cutoff = (datetime.now(tz=timezone.utc) + timedelta(days=days)).timestamp()
+        end_ts = self.end_ts
+        return [i for i in positions if end_ts[i] <= cutoff]
+    
+    def matching(self, positions: Iterable[int], term: str) -> List[int]:
+        """Keep positions whose text fields contain ``term`` (casefolded match)."""
+        needle = term.casefold()
+        blobs = self.search_blobs
+        return [i for i in positions if needle in blobs[i]]
+    
+    def max_odds_at_most(self, positions: Iterable[int], threshold: float) -> List[int]:
+        """Keep positions with a market whose highest outcome price is <= ``threshold``."""
+        prices = self.filter_prices
+        return [i for i in positions if prices[i] <= threshold]
+
+
+def create_http_session(pool_size: int = 32) -> requests.Session:
+    """Create a requests session with a keep-alive connection pool.
+    
+    Reusing one session avoids a TCP/TLS handshake on every Gamma API call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def _is_sports_market(market: dict, excluded: set[str]) -> bool:
@@ -589,10 +718,9 @@ def _has_extreme_odds(market: dict) -> bool:
     # Handle Gamma API format (outcomePrices)
     outcome_prices = market.get("outcomePrices")
     if outcome_prices:
-        import json
         if isinstance(outcome_prices, str):
             try:
-                outcome_prices = json.loads(outcome_prices)
+                outcome_prices = _json_loads(outcome_prices)
             except:
                 return False
         
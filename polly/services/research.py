@@ -111,12 +111,7 @@ def calculate_optimal_rounds(group: MarketGroup) -> int:
     top_3 = group.get_top_markets(3)
     if top_3:
         # Get Yes probability for top candidate
-        top_outcomes = top_3[0].outcomes
-        top_prob = 0.0
-        for outcome in top_outcomes:
-            if outcome.outcome.lower() in ('yes', 'y'):
-                top_prob = outcome.price
-                break
+        top_prob = top_3[0].yes_price
         
         if top_prob < 0.5:  # No candidate above 50%
             base_rounds += 5  # +5 rounds for uncertain race
@@ -135,9 +130,25 @@ class ResearchService:
     config: ResearchConfig
 
     def __post_init__(self) -> None:
-        # Avoid retaining a client across threads/event loops.
-        # We'll instantiate an AsyncClient inside the research worker.
-        pass
+        # The Grok AsyncClient is bound to the event loop that created it, so it
+        # is cached with that loop: consecutive runs on the CLI's shared runtime
+        # loop reuse its connections. Owners call close() on that loop when done.
+        self._client = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def has_client(self) -> bool:
+        """Whether a Grok client is currently cached."""
+        return self._client is not None
+
+    async def close(self) -> None:
+        """Close the cached Grok client; call on the loop it was created on."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None:
+            try:
+                await client.close()
+            except Exception:
+                pass
 
     async def conduct_research(
         self,
@@ -246,7 +257,21 @@ class ResearchService:
         )
 
     def _build_client(self):
-        """Initialize Grok client when dependencies and key are available."""
+        """Return the Grok client for the running loop, creating it on first use.
+
+        Returns None when xai-sdk or XAI_API_KEY is missing.
+        """
+
+        loop = asyncio.get_running_loop()
+        if self._client is not None:
+            if self._client_loop is loop:
+                return self._client
+            # Replacing it would leak the old client's connections, and it can
+            # only be closed on its own loop: that's a caller bug, not a retry
+            raise RuntimeError(
+                "ResearchService's Grok client belongs to another event loop; "
+                "await close() on that loop before researching on a new one."
+            )
 
         if util.find_spec("xai_sdk") is None:
             return None
@@ -259,7 +284,8 @@ class ResearchService:
         async_cls = getattr(module, "AsyncClient", None)
         if async_cls is None:
             raise RuntimeError("xai-sdk AsyncClient is required; install a recent xai-sdk.")
-        return async_cls(api_key=api_key)
+        self._client, self._client_loop = async_cls(api_key=api_key), loop
+        return self._client
     
     def _estimate_cost(
         self,
@@ -536,12 +562,7 @@ class ResearchService:
             "estimated_cost_usd": estimated_cost,
         }
 
-        # Close client to prevent pending tasks on loop shutdown
-        try:
-            await client.close()
-        except Exception:
-            pass
-
+        # Client stays open for the next run on this loop (see close())
         return result
     
     async def _run_group_research_with_grok(
@@ -777,12 +798,6 @@ class ResearchService:
         # Get tracker statistics
         tracker_stats = tracker.get_stats()
         
-        # Close client
-        try:
-            await client.close()
-        except Exception:
-            pass
-        
         return {
             "recommendations": recommendations,
             "rationale": rationale,
@@ -810,8 +825,8 @@ def _build_prompt(market: Market, config: ResearchConfig, total_rounds: int) ->
     Includes meta topic planning, X-source weighting, and odds-relative synthesis.
     """
 
-    odds = ", ".join(f"{name}: {price:.0%}" for name, price in market.formatted_odds().items())
-    options = ", ".join(market.formatted_odds().keys()) or "Yes, No"
+    odds = ", ".join(f"{name}: {price:.0%}" for name, price in market.price_by_outcome.items())
+    options = ", ".join(market.price_by_outcome) or "Yes, No"
     # Scoping removed by default for broader discovery
     domain_scope = ""
     x_scope = ""
@@ -888,7 +903,7 @@ def _build_group_prompt(group: MarketGroup, config: ResearchConfig, total_rounds
     candidates_info = []
     for market in top_markets:
         # Get Yes probability
-        yes_prob = next((o.price for o in market.outcomes if o.outcome.lower() in ('yes', 'y')), 0.0)
+        yes_prob = market.yes_price
         # Extract candidate name from question
         candidate = market.question.split("Will ")[-1].split(" win")[0] if "Will " in market.question else market.question
         candidates_info.append(f"  • {candidate}: {yes_prob:.1%} (${market.liquidity:,.0f} liquidity)")
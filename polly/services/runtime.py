@@ -0,0 +1,74 @@
+"""Persistent asyncio event loop shared by synchronous CLI command handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Awaitable, Optional, TypeVar
+
+try:
+    import uvloop  # Optional: faster libuv-based event loop
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use."""
+    global _loop, _thread
+    with _loop_lock:
+        if _loop is None:
+            # Use uvloop when installed, otherwise the default asyncio loop
+            loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="polly-runtime", daemon=True
+            )
+            thread.start()
+            _loop, _thread = loop, thread
+        return _loop
+
+
+def shutdown_loop(timeout: float = 5.0) -> None:
+    """Stop the background loop and close it; no-op if it was never started.
+
+    Called once at CLI exit. A later get_loop() would start a fresh loop.
+
+    Args:
+        timeout: Seconds to wait for the loop thread to finish
+    """
+    global _loop, _thread
+    with _loop_lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = None
+    if loop is None or thread is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout)
+    if not thread.is_alive():
+        loop.close()
+
+
+def run_coro(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared loop and block until it finishes.
+
+    Unlike asyncio.run, the loop (and anything bound to it) survives between
+    commands, so repeated calls skip loop setup/teardown.
+
+    Args:
+        coro: Coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # Ctrl-C while waiting: don't leave the coroutine running in the background
+        future.cancel()
+        raise
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import sqlite3
 from dataclasses import asdict
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -32,10 +32,17 @@ CREATE TABLE IF NOT EXISTS research (
     eval_edge REAL,
     eval_recommendation TEXT,
     user_decision TEXT,
-    decision_at TEXT
+    decision_at TEXT,
+    market_end_date TEXT
 );
 """
 
+# Created after _ensure_columns so older databases have the columns first
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_research_decision ON research(user_decision);
+CREATE INDEX IF NOT EXISTS idx_research_end_date ON research(market_end_date);
+"""
+
 
 class ResearchRepository:
     """Handles persistence of research results by market."""
@@ -46,6 +53,7 @@ class ResearchRepository:
         with self._connect() as connection:
             connection.executescript(SCHEMA)
             self._ensure_columns(connection)
+            connection.executescript(INDEXES)
 
     def _ensure_columns(self, connection: sqlite3.Connection) -> None:
         """Add missing schema columns for backward compatibility."""
@@ -56,6 +64,8 @@ class ResearchRepository:
             to_add.append(("user_decision", "TEXT"))
         if "decision_at" not in names:
             to_add.append(("decision_at", "TEXT"))
+        if "market_end_date" not in names:
+            to_add.append(("market_end_date", "TEXT"))
         for col, col_type in to_add:
             connection.execute(f"ALTER TABLE research ADD COLUMN {col} {col_type}")
 
@@ -64,8 +74,13 @@ class ResearchRepository:
         result: ResearchResult,
         eval_edge: float,
         eval_recommendation: str,
+        market_end_date: Optional[datetime] = None,
     ) -> None:
-        """Insert or replace a research result for a market."""
+        """Insert or replace a research result for a market.
+
+        market_end_date is stored denormalized so archived history can be
+        answered by an indexed query without refetching markets.
+        """
 
         payload = asdict(result)
         with self._connect() as connection:
@@ -75,8 +90,8 @@ class ResearchRepository:
                     market_id, prediction, probability, confidence, rationale,
                     key_findings, citations, rounds_completed, created_at,
                     duration_minutes, prompt_tokens, completion_tokens, reasoning_tokens,
-                    estimated_cost_usd, eval_edge, eval_recommendation
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    estimated_cost_usd, eval_edge, eval_recommendation, market_end_date
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(market_id) DO UPDATE SET
                     prediction=excluded.prediction,
                     probability=excluded.probability,
@@ -92,7 +107,8 @@ class ResearchRepository:
                     reasoning_tokens=excluded.reasoning_tokens,
                     estimated_cost_usd=excluded.estimated_cost_usd,
                     eval_edge=excluded.eval_edge,
-                    eval_recommendation=excluded.eval_recommendation
+                    eval_recommendation=excluded.eval_recommendation,
+                    market_end_date=COALESCE(excluded.market_end_date, research.market_end_date)
                 """,
                 (
                     payload["market_id"],
@@ -111,21 +127,24 @@ class ResearchRepository:
                     payload["estimated_cost_usd"],
                     float(eval_edge),
                     str(eval_recommendation),
+                    _utc_iso(market_end_date) if market_end_date else None,
                 ),
             )
 
+    def record_end_dates(self, end_dates: dict[str, datetime]) -> None:
+        """Backfill market end dates (e.g. after markets are fetched for display)."""
+        if not end_dates:
+            return
+        with self._connect() as connection:
+            connection.executemany(
+                "UPDATE research SET market_end_date = ? WHERE market_id = ?",
+                [(_utc_iso(end), market_id) for market_id, end in end_dates.items()],
+            )
+
     def set_decision(self, market_id: str, decision: str) -> None:
         """Persist a user decision (enter/pass) for a researched market."""
-        now_iso = datetime.utcnow().isoformat()
         with self._connect() as connection:
-            connection.execute(
-                """
-                UPDATE research
-                SET user_decision = ?, decision_at = ?
-                WHERE market_id = ?
-                """,
-                (decision, now_iso, market_id),
-            )
+            set_decision_in(connection, market_id, decision)
 
     def get_decision(self, market_id: str) -> Optional[str]:
         with self._connect() as connection:
@@ -154,6 +173,24 @@ class ResearchRepository:
             return None
         return self._row_to_result(row)
 
+    def get_with_decision(
+        self, market_id: str
+    ) -> Optional[tuple[ResearchResult, float, str, Optional[str]]]:
+        """Return research, evaluation and user decision for a market in one query.
+
+        Returns a tuple of (ResearchResult, eval_edge, eval_recommendation, user_decision)
+        or None. user_decision lives on the same row, so no join is needed.
+        """
+
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT * FROM research WHERE market_id = ?",
+                (market_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return (*self._row_to_result(row), row["user_decision"])
+
     def has_research(self, market_id: str) -> bool:
         with self._connect() as connection:
             row = connection.execute(
@@ -162,24 +199,34 @@ class ResearchRepository:
             ).fetchone()
         return bool(row)
 
-    def list(self, decision: str = "all") -> list[dict]:
+    def list(self, decision: str = "all", archived_before: Optional[datetime] = None) -> list[dict]:
         """Return basic research rows for history display.
 
         decision: "all" | "undecided" | "decided"
+        archived_before: if set, only rows whose market ended before this time,
+            plus rows with no stored end date ("end_date" is None) for the caller
+            to check against the market itself
         """
-        where = ""
+        clauses: list[str] = []
+        params: list[str] = []
         if decision == "undecided":
-            where = "WHERE user_decision IS NULL"
+            clauses.append("user_decision IS NULL")
         elif decision == "decided":
-            where = "WHERE user_decision IS NOT NULL"
+            clauses.append("user_decision IS NOT NULL")
+        if archived_before is not None:
+            clauses.append("(market_end_date < ? OR market_end_date IS NULL)")
+            params.append(_utc_iso(archived_before))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         with self._connect() as connection:
             cursor = connection.execute(
                 f"""
-                SELECT market_id, created_at, eval_edge, eval_recommendation, user_decision
+                SELECT market_id, created_at, eval_edge, eval_recommendation, user_decision,
+                       market_end_date
                 FROM research
                 {where}
                 ORDER BY datetime(created_at) DESC
-                """
+                """,
+                params,
             )
             rows = cursor.fetchall()
         out: list[dict] = []
@@ -191,6 +238,7 @@ class ResearchRepository:
                     "edge": r["eval_edge"],
                     "rec": r["eval_recommendation"],
                     "decision": r["user_decision"],
+                    "end_date": r["market_end_date"],
                 }
             )
         return out
@@ -225,3 +273,21 @@ class ResearchRepository:
         return connection
 
 
+def set_decision_in(connection: sqlite3.Connection, market_id: str, decision: str) -> None:
+    """Record a user decision on a research row using the caller's transaction."""
+    now_iso = datetime.utcnow().isoformat()
+    connection.execute(
+        """
+        UPDATE research
+        SET user_decision = ?, decision_at = ?
+        WHERE market_id = ?
+        """,
+        (decision, now_iso, market_id),
+    )
+
+
+def _utc_iso(value: datetime) -> str:
+    """Normalize to a UTC ISO string so stored dates compare correctly as text."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import sqlite3
-from dataclasses import asdict
+from dataclasses import fields
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, List
 
-from polly.models import PortfolioMetrics, Trade
+from polly.models import PortfolioMetrics, PortfolioSnapshot, Trade
+from polly.storage.research import set_decision_in
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS trades (
@@ -60,6 +61,17 @@ CREATE TABLE IF NOT EXISTS trade_groups (
 );
 """
 
+# Trade attributes read into the INSERT payload. A shallow read: dataclasses.asdict
+# would deep-copy every value (datetimes included) just to build the row.
+_TRADE_FIELDS = tuple(f.name for f in fields(Trade) if f.name != "id")
+
+# Created after _ensure_columns so older databases have trade_mode first.
+# Serves list_active/list_history and the metrics aggregates, which all
+# filter on mode + status (history also orders by closed_at).
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_trades_mode_status_closed ON trades(trade_mode, status, closed_at DESC);
+"""
+
 
 class TradeRepository:
     """Handles persistence of paper trades."""
@@ -70,47 +82,62 @@ class TradeRepository:
         with self._connect() as connection:
             connection.executescript(SCHEMA)
             self._ensure_columns(connection)
+            connection.executescript(INDEXES)
 
     def record_trade(self, trade: Trade) -> Trade:
         """Insert a new trade and return the stored entity."""
 
-        payload = asdict(trade)
-        payload.pop("id", None)
         with self._connect() as connection:
-            cursor = connection.execute(
-                """
-                INSERT INTO trades (
-                    market_id, question, category, selected_option, entry_odds, stake_amount,
-                    entry_timestamp, predicted_probability, confidence, research_id,
-                    status, resolves_at, actual_outcome, profit_loss, closed_at,
-                    trade_mode, order_id, event_id, event_title, is_grouped, group_strategy
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    payload["market_id"],
-                    payload["question"],
-                    payload.get("category"),
-                    payload["selected_option"],
-                    payload["entry_odds"],
-                    payload["stake_amount"],
-                    payload["entry_timestamp"].isoformat(),
-                    payload["predicted_probability"],
-                    payload["confidence"],
-                    payload["research_id"],
-                    payload["status"],
-                    payload["resolves_at"].isoformat(),
-                    payload["actual_outcome"],
-                    payload["profit_loss"],
-                    payload["closed_at"].isoformat() if payload["closed_at"] else None,
-                    payload.get("trade_mode", "paper"),
-                    payload.get("order_id"),
-                    payload.get("event_id"),
-                    payload.get("event_title"),
-                    payload.get("is_grouped", False),
-                    payload.get("group_strategy"),
-                ),
-            )
-            trade_id = cursor.lastrowid
+            return self._insert_trade(connection, trade)
+
+    def record_trade_and_decision(self, trade: Trade, market_id: str, decision: str) -> Trade:
+        """Insert a trade and set the user decision on its research in one transaction.
+
+        The research row lives in the same database (see ResearchRepository);
+        committing both together means one fsync and no trade without its decision.
+        """
+
+        with self._connect() as connection:
+            saved = self._insert_trade(connection, trade)
+            set_decision_in(connection, market_id, decision)
+        return saved
+
+    def _insert_trade(self, connection: sqlite3.Connection, trade: Trade) -> Trade:
+        payload = {name: getattr(trade, name) for name in _TRADE_FIELDS}
+        cursor = connection.execute(
+            """
+            INSERT INTO trades (
+                market_id, question, category, selected_option, entry_odds, stake_amount,
+                entry_timestamp, predicted_probability, confidence, research_id,
+                status, resolves_at, actual_outcome, profit_loss, closed_at,
+                trade_mode, order_id, event_id, event_title, is_grouped, group_strategy
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                payload["market_id"],
+                payload["question"],
+                payload.get("category"),
+                payload["selected_option"],
+                payload["entry_odds"],
+                payload["stake_amount"],
+                payload["entry_timestamp"].isoformat(),
+                payload["predicted_probability"],
+                payload["confidence"],
+                payload["research_id"],
+                payload["status"],
+                payload["resolves_at"].isoformat(),
+                payload["actual_outcome"],
+                payload["profit_loss"],
+                payload["closed_at"].isoformat() if payload["closed_at"] else None,
+                payload.get("trade_mode", "paper"),
+                payload.get("order_id"),
+                payload.get("event_id"),
+                payload.get("event_title"),
+                payload.get("is_grouped", False),
+                payload.get("group_strategy"),
+            ),
+        )
+        trade_id = cursor.lastrowid
         return Trade(id=trade_id, **payload)
 
     def update_trade_outcome(self, trade_id: int, actual_outcome: str, profit_loss: float) -> None:
@@ -131,15 +158,7 @@ class TradeRepository:
         """Return recent trades for the dashboard."""
 
         with self._connect() as connection:
-            cursor = connection.execute(
-                """
-                SELECT * FROM trades
-                ORDER BY entry_timestamp DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
-            rows = cursor.fetchall()
+            rows = self._select_recent(connection, limit)
         return [self._row_to_trade(row) for row in rows]
 
     def metrics(self, starting_cash: float = 0.0, filter_mode: str | None = None, real_balance: float | None = None) -> PortfolioMetrics:
@@ -151,48 +170,88 @@ class TradeRepository:
             real_balance: Actual on-chain balance for real mode (overrides paper tracking formula)
         """
 
-        mode_filter = f"AND trade_mode = '{filter_mode}'" if filter_mode else ""
-        
         with self._connect() as connection:
-            active_count = connection.execute(
-                f"SELECT COUNT(*) FROM trades WHERE status = 'active' {mode_filter}"
-            ).fetchone()[0]
-
-            resolved_rows = connection.execute(
-                f"""
-                SELECT COUNT(*) AS total, SUM(CASE WHEN status = 'won' THEN 1 ELSE 0 END) AS wins,
-                       SUM(stake_amount) AS total_stake, SUM(COALESCE(profit_loss, 0)) AS total_profit,
-                       MIN(entry_timestamp) AS first_entry
-                FROM trades
-                WHERE status IN ('won', 'lost') {mode_filter}
-                """
-            ).fetchone()
+            return self._compute_metrics(connection, starting_cash, filter_mode, real_balance)
+
+    def portfolio_snapshot(
+        self,
+        starting_cash: float = 0.0,
+        filter_mode: str | None = None,
+        real_balance: float | None = None,
+    ) -> PortfolioSnapshot:
+        """Return metrics and active trades for the portfolio view in one connection.
+        
+        Recent trades that are still active reuse the Trade objects already
+        built for active_trades instead of being converted twice.
+        
+        Args:
+            starting_cash: Starting cash balance for paper trading
+            filter_mode: Optional filter for trade mode ("paper" or "real")
+            real_balance: Actual on-chain balance for real mode
+        """
 
-            # Largest win/loss and per-category realized profit
-            cat_rows = connection.execute(
-                f"""
-                SELECT COALESCE(category, 'Unknown') AS category, SUM(COALESCE(profit_loss,0)) AS profit
-                FROM trades
-                WHERE status IN ('won','lost','closed') {mode_filter}
-                GROUP BY category
-                """
-            ).fetchall()
-            realized_rows = connection.execute(
-                f"""
-                SELECT MAX(COALESCE(profit_loss,0)) AS max_win,
-                       MIN(COALESCE(profit_loss,0)) AS max_loss
-                FROM trades
-                WHERE status IN ('won','lost','closed') {mode_filter}
-                """
-            ).fetchone()
+        with self._connect() as connection:
+            active_trades = self._select_active(connection, filter_mode)
+            metrics = self._compute_metrics(
+                connection,
+                starting_cash,
+                filter_mode,
+                real_balance,
+                known_trades={t.id: t for t in active_trades},
+            )
+        return PortfolioSnapshot(metrics=metrics, active_trades=active_trades)
+
+    def _compute_metrics(
+        self,
+        connection: sqlite3.Connection,
+        starting_cash: float,
+        filter_mode: str | None,
+        real_balance: float | None,
+        known_trades: dict[int, Trade] | None = None,
+    ) -> PortfolioMetrics:
+        """Run the metrics queries on an open connection."""
 
-            # Balances
-            cash_in_play = connection.execute(
-                f"SELECT SUM(stake_amount) FROM trades WHERE status = 'active' {mode_filter}"
-            ).fetchone()[0] or 0.0
-            realized_total = connection.execute(
-                f"SELECT SUM(COALESCE(profit_loss,0)) FROM trades WHERE status IN ('won','lost','closed') {mode_filter}"
-            ).fetchone()[0] or 0.0
+        mode_filter = f"AND trade_mode = '{filter_mode}'" if filter_mode else ""
+        
+        active_count = connection.execute(
+            f"SELECT COUNT(*) FROM trades WHERE status = 'active' {mode_filter}"
+        ).fetchone()[0]
+
+        resolved_rows = connection.execute(
+            f"""
+            SELECT COUNT(*) AS total, SUM(CASE WHEN status = 'won' THEN 1 ELSE 0 END) AS wins,
+                   SUM(stake_amount) AS total_stake, SUM(COALESCE(profit_loss, 0)) AS total_profit,
+                   MIN(entry_timestamp) AS first_entry
+            FROM trades
+            WHERE status IN ('won', 'lost') {mode_filter}
+            """
+        ).fetchone()
+
+        # Largest win/loss and per-category realized profit
+        cat_rows = connection.execute(
+            f"""
+            SELECT COALESCE(category, 'Unknown') AS category, SUM(COALESCE(profit_loss,0)) AS profit
+            FROM trades
+            WHERE status IN ('won','lost','closed') {mode_filter}
+            GROUP BY category
+            """
+        ).fetchall()
+        realized_rows = connection.execute(
+            f"""
+            SELECT MAX(COALESCE(profit_loss,0)) AS max_win,
+                   MIN(COALESCE(profit_loss,0)) AS max_loss
+            FROM trades
+            WHERE status IN ('won','lost','closed') {mode_filter}
+            """
+        ).fetchone()
+
+        # Balances
+        cash_in_play = connection.execute(
+            f"SELECT SUM(stake_amount) FROM trades WHERE status = 'active' {mode_filter}"
+        ).fetchone()[0] or 0.0
+        realized_total = connection.execute(
+            f"SELECT SUM(COALESCE(profit_loss,0)) FROM trades WHERE status IN ('won','lost','closed') {mode_filter}"
+        ).fetchone()[0] or 0.0
 
         total_resolved = resolved_rows[0] or 0
         wins = resolved_rows[1] or 0
@@ -211,7 +270,10 @@ class TradeRepository:
             if base > 0:
                 projected_apr = base ** (365 / days) - 1
 
-        recent_trades = self.list_recent()
+        # PortfolioMetrics.recent_trades is public; the portfolio panel sizes its win count from it
+        recent_rows = self._select_recent(connection, 5)
+        known_trades = known_trades or {}
+        recent_trades = [known_trades.get(row["id"]) or self._row_to_trade(row) for row in recent_rows]
 
         profit_by_category = {row[0]: float(row[1] or 0.0) for row in cat_rows}
         best_category = None
@@ -247,16 +309,28 @@ class TradeRepository:
 
     def list_active(self, filter_mode: str | None = None) -> List[Trade]:
         """List all active trades, optionally filtered by mode."""
-        mode_filter = f"AND trade_mode = '{filter_mode}'" if filter_mode else ""
         with self._connect() as connection:
-            cursor = connection.execute(
-                f"""
-                SELECT * FROM trades
-                WHERE status = 'active' {mode_filter}
-                ORDER BY entry_timestamp DESC
-                """
-            )
-            rows = cursor.fetchall()
+            return self._select_active(connection, filter_mode)
+
+    def _select_recent(self, connection: sqlite3.Connection, limit: int) -> List[sqlite3.Row]:
+        return connection.execute(
+            """
+            SELECT * FROM trades
+            ORDER BY entry_timestamp DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+
+    def _select_active(self, connection: sqlite3.Connection, filter_mode: str | None) -> List[Trade]:
+        mode_filter = f"AND trade_mode = '{filter_mode}'" if filter_mode else ""
+        rows = connection.execute(
+            f"""
+            SELECT * FROM trades
+            WHERE status = 'active' {mode_filter}
+            ORDER BY entry_timestamp DESC
+            """
+        ).fetchall()
         return [self._row_to_trade(row) for row in rows]
 
     def list_history(self, limit: int = 20, filter_mode: str | None = None) -> List[Trade]:
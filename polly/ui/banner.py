@@ -1,8 +1,6 @@
 """ASCII banner and welcome message for Polly CLI."""
 
-from rich.console import Console
-
-console = Console()
+from polly.ui.console import console
 
 BANNER = """[yellow]╔═══════════════════════════════════════════════╗
 ║    ██████╗  ██████╗ ██╗     ██╗  ██╗   ██╗    ║
@@ -0,0 +1,6 @@
+"""Shared Rich console for Polly CLI."""
+
+from rich.console import Console
+
+# Single instance: Console() probes the terminal (isatty, colors, size) on creation
+console = Console()
@@ -3,13 +3,11 @@
 from datetime import timedelta
 from typing import Dict, List
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from polly.models import Market, MarketGroup, PortfolioMetrics, Trade
-
-console = Console()
+from polly.ui.console import console
 
 
 def format_odds(odds_dict: Dict[str, float]) -> str:
@@ -70,16 +68,39 @@ def format_payout(stake: float, odds: float) -> str:
     return f"${payout:.2f} (+{gain_pct:.0f}%)"
 
 
+# (threshold, divisor, suffix) from largest to smallest, plus decimals per mode
+_LIQUIDITY_UNITS = ((1_000_000, 1_000_000, "M"), (1_000, 1_000, "k"), (0, 1, ""))
+_LIQUIDITY_DECIMALS = {False: {"M": 1, "k": 0, "": 0}, True: {"M": 2, "k": 1, "": 0}}
+
+
+def format_liquidity(value: float, precise: bool = False) -> str:
+    """Format a dollar amount with a k/M suffix.
+    
+    Examples: 2_500_000 -> "$2.5M", 48_200 -> "$48k" (precise: "$2.50M", "$48.2k")
+    """
+    for threshold, divisor, suffix in _LIQUIDITY_UNITS:
+        if value >= threshold:
+            break
+    decimals = _LIQUIDITY_DECIMALS[precise][suffix]
+    return f"${value / divisor:.{decimals}f}{suffix}"
+
+
 def create_polls_table(items: List[Market | MarketGroup]) -> Table:
     """Create Rich table for displaying polls (both binary markets and grouped events)."""
-    table = Table(title="Available Polls", show_header=True, header_style="bold cyan")
+    # Fixed widths, no wrapping, no auto-expand: keeps Rich's measurement pass cheap.
+    # Cells below are pre-truncated to fit their column.
+    table = Table(
+        title="Available Polls", show_header=True, header_style="bold cyan",
+        show_lines=False, expand=False, pad_edge=False,
+        padding=(0, 1), collapse_padding=True,
+    )
     
-    table.add_column("ID", style="dim", width=3)
-    table.add_column("Category", style="cyan", width=12)
-    table.add_column("Question", style="white", width=55)
-    table.add_column("Odds", style="yellow", width=12, justify="right")
-    table.add_column("Expires", style="magenta", width=8)
-    table.add_column("Liquidity", style="green", justify="right", width=10)
+    table.add_column("ID", style="dim", width=3, no_wrap=True)
+    table.add_column("Category", style="cyan", width=12, no_wrap=True)
+    table.add_column("Question", style="white", width=55, no_wrap=True)
+    table.add_column("Odds", style="yellow", width=12, justify="right", no_wrap=True)
+    table.add_column("Expires", style="magenta", width=8, no_wrap=True)
+    table.add_column("Liquidity", style="green", justify="right", width=10, no_wrap=True)
     
     for i, item in enumerate(items, 1):
         if isinstance(item, MarketGroup):
@@ -87,12 +108,7 @@ def create_polls_table(items: List[Market | MarketGroup]) -> Table:
             time_str = format_time_remaining(item.time_remaining)
             
             # Show liquidity with k/M suffix
-            if item.liquidity >= 1_000_000:
-                liquidity_str = f"${item.liquidity/1_000_000:.1f}M"
-            elif item.liquidity >= 1_000:
-                liquidity_str = f"${item.liquidity/1_000:.0f}k"
-            else:
-                liquidity_str = f"${item.liquidity:.0f}"
+            liquidity_str = format_liquidity(item.liquidity)
             
             # Truncate category
             category = item.category or "Other"
@@ -109,7 +125,7 @@ def create_polls_table(items: List[Market | MarketGroup]) -> Table:
             if top_markets:
                 top_preview = ", ".join([
                     f"{m.question.split('Will ')[-1].split(' win')[0] if 'Will ' in m.question else m.question[:15]}"
-                    f" {next((o.price for o in m.outcomes if o.outcome.lower() in ('yes', 'y')), 0.0):.0%}"
+                    f" {m.yes_price:.0%}"
                     for m in top_markets
                 ])
                 if len(top_preview) > 50:
@@ -131,16 +147,11 @@ def create_polls_table(items: List[Market | MarketGroup]) -> Table:
             )
         else:
             # Display individual binary market
-            odds_str = format_odds(item.formatted_odds())
+            odds_str = format_odds(item.price_by_outcome)
             time_str = format_time_remaining(item.time_remaining)
             
             # Show liquidity with k/M suffix
-            if item.liquidity >= 1_000_000:
-                liquidity_str = f"${item.liquidity/1_000_000:.1f}M"
-            elif item.liquidity >= 1_000:
-                liquidity_str = f"${item.liquidity/1_000:.0f}k"
-            else:
-                liquidity_str = f"${item.liquidity:.0f}"
+            liquidity_str = format_liquidity(item.liquidity)
             
             # Truncate category
             category = item.category or "Other"
@@ -256,6 +267,10 @@ def create_active_positions_table(trades: List[Trade], live_positions: List[dict
     return table
 
 
+# Trade statuses shown in the recent trades table
+_DONE_STATES = frozenset(("won", "lost", "closed"))
+
+
 def create_recent_trades_table(trades: List[Trade]) -> Table:
     """Create Rich table for recent resolved trades."""
     table = Table(title="Recent Trades", show_header=True, header_style="bold cyan")
@@ -266,7 +281,7 @@ def create_recent_trades_table(trades: List[Trade]) -> Table:
     table.add_column("Duration", style="magenta", width=10)
     
     for trade in trades[:10]:  # Only show last 10
-        if trade.status not in ("won", "lost", "closed"):
+        if trade.status not in _DONE_STATES:
             continue
             
         question = trade.question